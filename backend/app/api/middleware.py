@@ -2,17 +2,38 @@
 
 import time
 import logging
+from functools import lru_cache
 from typing import Callable
 from fastapi import Request, Response, status
-from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from app.core.config import settings
 from app.core.exceptions import FPLOptimizerException
-from app.schemas.responses import ErrorResponse, ErrorDetail
+from app.schemas.responses import ErrorResponse, ErrorDetail, HealthResponse
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _error_body(message: str, detail_message: str, error_type: str) -> bytes:
+    """Encode an error response body, memoized for repeated errors.
+
+    Args:
+        message: Top-level error message
+        detail_message: Error detail message
+        error_type: Error detail type
+
+    Returns:
+        JSON-encoded ErrorResponse
+    """
+    return ErrorResponse(
+        success=False,
+        message=message,
+        errors=[ErrorDetail(message=detail_message, type=error_type)],
+    ).model_dump_json(exclude_none=True).encode()
+
+
 class LoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for logging requests and responses."""
 
@@ -26,8 +47,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         Returns:
             Response from endpoint
         """
-        # Start timer
-        start_time = time.time()
+        # Start timer (monotonic, unaffected by wall-clock adjustments)
+        start_time = time.monotonic()
 
         # Get request details
         method = request.method
@@ -35,18 +56,19 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         client_ip = request.client.host if request.client else "unknown"
 
         # Log request
-        logger.info(f"Request: {method} {path} from {client_ip}")
+        logger.info("Request: %s %s from %s", method, path, client_ip)
 
         # Process request
         response = await call_next(request)
 
         # Calculate duration
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
 
         # Log response
         logger.info(
-            f"Response: {method} {path} - Status: {response.status_code} - "
-            f"Duration: {duration:.3f}s"
+            "Response: %s %s - Status: %s - "
+            "Duration: %.3fs",
+            method, path, response.status_code, duration
         )
 
         # Add custom headers
@@ -77,25 +99,19 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
         except FPLOptimizerException as e:
             # Handle custom application exceptions
-            logger.error(f"Application error: {e.message}", exc_info=True)
-            return JSONResponse(
+            logger.error("Application error: %s", e.message, exc_info=True)
+            return Response(
+                content=_error_body(e.message, e.message, type(e).__name__),
                 status_code=e.status_code,
-                content=ErrorResponse(
-                    success=False,
-                    message=e.message,
-                    errors=[ErrorDetail(message=e.message, type=type(e).__name__)],
-                ).model_dump(),
+                media_type="application/json",
             )
         except Exception as e:
             # Handle unexpected exceptions
-            logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-            return JSONResponse(
+            logger.error("Unexpected error: %s", e, exc_info=True)
+            return Response(
+                content=_error_body("An unexpected error occurred", str(e), "InternalServerError"),
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content=ErrorResponse(
-                    success=False,
-                    message="An unexpected error occurred",
-                    errors=[ErrorDetail(message=str(e), type="InternalServerError")],
-                ).model_dump(),
+                media_type="application/json",
             )
 
 
@@ -121,3 +137,63 @@ class CORSSecurityMiddleware(BaseHTTPMiddleware):
         response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
 
         return response
+
+
+class HealthProbeMiddleware:
+    """Pure ASGI middleware answering liveness probes.
+
+    Requests to ``LIVENESS_PATH`` are answered with a pre-encoded body before
+    they reach the FastAPI middleware stack, so frequent platform probes cost
+    no logging, header or routing work. Everything else passes through.
+    """
+
+    LIVENESS_PATH = "/healthz"
+    ALLOWED_METHODS = ("GET", "HEAD")
+
+    _BODY = HealthResponse(
+        status="healthy",
+        version=settings.app_version,
+        environment=settings.environment,
+    ).model_dump_json().encode()
+    _HEADERS = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_BODY)).encode()),
+        (b"cache-control", b"no-store"),
+    ]
+    _NOT_ALLOWED_HEADERS = [
+        (b"allow", ", ".join(ALLOWED_METHODS).encode()),
+        (b"content-length", b"0"),
+    ]
+
+    def __init__(self, app: ASGIApp):
+        """Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Answer liveness probes or delegate to the wrapped application.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http" or scope["path"] != self.LIVENESS_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method not in self.ALLOWED_METHODS:
+            await send({
+                "type": "http.response.start",
+                "status": status.HTTP_405_METHOD_NOT_ALLOWED,
+                "headers": self._NOT_ALLOWED_HEADERS,
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send({"type": "http.response.start", "status": status.HTTP_200_OK, "headers": self._HEADERS})
+        await send({"type": "http.response.body", "body": b"" if method == "HEAD" else self._BODY})
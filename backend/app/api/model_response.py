@@ -0,0 +1,39 @@
+"""Pre-encoded JSON responses for pydantic models."""
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def model_json_response(model: BaseModel) -> Response:
+    """Serialize a response model directly with pydantic-core.
+
+    The model class's compiled serializer is reused for every call, and
+    FastAPI's response_model re-validation and encoding are skipped. Routes
+    still declare ``response_model`` so the OpenAPI schema is unchanged.
+
+    Args:
+        model: Response model to send
+
+    Returns:
+        JSON response with the pre-encoded body
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def envelope_json_response(message: str, data_json: bytes) -> Response:
+    """Send a success envelope around an already encoded ``data`` payload.
+
+    Only the message is encoded per call; the data bytes are spliced in
+    unchanged. The body matches ``model_json_response`` for a successful
+    ``BaseResponse`` carrying the same data.
+
+    Args:
+        message: Response message
+        data_json: JSON-encoded response data
+
+    Returns:
+        JSON response with the assembled body
+    """
+    body = b'{"success":true,"message":' + orjson.dumps(message) + b',"data":' + data_json + b"}"
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,25 @@
+"""orjson-backed JSON response class."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Accepts int dictionary keys and numpy values, both of which appear in
+    service results (player ID maps, solver outputs).
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Render content to JSON bytes.
+
+        Args:
+            content: JSON-compatible content
+
+        Returns:
+            Encoded response body
+        """
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
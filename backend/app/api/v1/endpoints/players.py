@@ -1,12 +1,19 @@
 """Player endpoints."""
 
+import asyncio
 import logging
-from typing import Optional, List
-from fastapi import APIRouter, Query, Depends
+from typing import Optional
+from fastapi import APIRouter, Query, Depends, Response
 
 from app.api.dependencies import PlayerServiceDep
-from app.schemas.responses import PlayersResponse, BaseResponse
-from app.models.player import Player
+from app.api.model_response import envelope_json_response, model_json_response
+from app.schemas.responses import (
+    PlayersResponse,
+    PlayerResponse,
+    PlayersWithFixturesResponse,
+)
+from app.schemas.examples import PLAYER_RESPONSE_EXAMPLE, example_response
+from app.models.player_filters import PlayerFilters
 from app.models.player_with_fixtures import PlayerWithFixtures
 from app.core.container import container
 
@@ -35,7 +42,7 @@ async def get_all_players(
     max_cost: Optional[float] = Query(
         None, description="Maximum cost in millions (e.g., 13.0)", ge=0
     ),
-) -> PlayersResponse:
+) -> Response:
     """Get all FPL players with optional filters.
 
     Args:
@@ -49,10 +56,16 @@ async def get_all_players(
         List of players matching the filters
     """
     logger.info(
-        f"GET /players - position={position}, team_id={team_id}, "
-        f"min_cost={min_cost}, max_cost={max_cost}"
+        "GET /players - position=%s, team_id=%s, "
+        "min_cost=%s, max_cost=%s",
+        position, team_id, min_cost, max_cost
     )
 
+    # The unfiltered list is the full snapshot, whose encoding is reused
+    if PlayerFilters.from_query(position, team_id, min_cost, max_cost).is_empty:
+        count, players_json = await player_service.get_all_players_json()
+        return envelope_json_response(f"Retrieved {count} players successfully", players_json)
+
     players = await player_service.get_all_players(
         position=position,
         team_id=team_id,
@@ -60,24 +73,28 @@ async def get_all_players(
         max_cost=max_cost,
     )
 
-    return PlayersResponse(
-        success=True,
-        message=f"Retrieved {len(players)} players successfully",
-        data=players,
+    return model_json_response(
+        PlayersResponse.model_construct(
+            success=True,
+            message=f"Retrieved {len(players)} players successfully",
+            # The unfiltered result is the shared snapshot tuple
+            data=list(players),
+        )
     )
 
 
 @router.get(
     "/players/{player_id}",
-    response_model=BaseResponse[Player],
+    response_model=PlayerResponse,
     summary="Get Player by ID",
     description="Retrieve a specific player by their ID",
     tags=["Players"],
+    responses=example_response(PLAYER_RESPONSE_EXAMPLE),
 )
 async def get_player_by_id(
     player_id: int,
     player_service: PlayerServiceDep,
-) -> BaseResponse[Player]:
+) -> Response:
     """Get a specific player by ID.
 
     Args:
@@ -87,14 +104,16 @@ async def get_player_by_id(
     Returns:
         Player data
     """
-    logger.info(f"GET /players/{player_id}")
+    logger.info("GET /players/%s", player_id)
 
     player = await player_service.get_player_by_id(player_id)
 
-    return BaseResponse(
-        success=True,
-        message=f"Player {player_id} retrieved successfully",
-        data=player,
+    return model_json_response(
+        PlayerResponse.model_construct(
+            success=True,
+            message=f"Player {player_id} retrieved successfully",
+            data=player,
+        )
     )
 
 
@@ -108,7 +127,7 @@ async def get_player_by_id(
 async def get_top_players(
     player_service: PlayerServiceDep,
     limit: int = Query(10, description="Number of players to return", ge=1, le=100),
-) -> PlayersResponse:
+) -> Response:
     """Get top players by total points.
 
     Args:
@@ -118,20 +137,22 @@ async def get_top_players(
     Returns:
         List of top players
     """
-    logger.info(f"GET /players/top/points?limit={limit}")
+    logger.info("GET /players/top/points?limit=%s", limit)
 
     players = await player_service.get_top_players_by_points(limit)
 
-    return PlayersResponse(
-        success=True,
-        message=f"Retrieved top {len(players)} players successfully",
-        data=players,
+    return model_json_response(
+        PlayersResponse.model_construct(
+            success=True,
+            message=f"Retrieved top {len(players)} players successfully",
+            data=players,
+        )
     )
 
 
 @router.get(
     "/players/fixtures/upcoming",
-    response_model=BaseResponse[List[PlayerWithFixtures]],
+    response_model=PlayersWithFixturesResponse,
     summary="Get All Players with Upcoming Fixture Difficulty",
     description="Retrieve all players with expected points for the next 5 gameweeks",
     tags=["Players"],
@@ -149,7 +170,7 @@ async def get_players_with_upcoming_fixtures(
     max_cost: Optional[float] = Query(
         None, description="Maximum cost in millions (e.g., 13.0)", ge=0
     ),
-) -> BaseResponse[List[PlayerWithFixtures]]:
+) -> Response:
     """Get all players with expected points for next 5 gameweeks.
 
     Args:
@@ -163,36 +184,40 @@ async def get_players_with_upcoming_fixtures(
         List of players with expected points for upcoming fixtures
     """
     logger.info(
-        f"GET /players/fixtures/upcoming - position={position}, team_id={team_id}, "
-        f"min_cost={min_cost}, max_cost={max_cost}"
-    )
-
-    # Get all players
-    all_players = await player_service.get_all_players(
-        position=position,
-        team_id=team_id,
-        min_cost=min_cost,
-        max_cost=max_cost,
+        "GET /players/fixtures/upcoming - position=%s, team_id=%s, "
+        "min_cost=%s, max_cost=%s",
+        position, team_id, min_cost, max_cost
     )
 
     # Get expected points service from container
     expected_points_service = container.expected_points_service()
 
-    # Calculate expected points for next 5 gameweeks
-    expected_points_map = await expected_points_service.calculate_expected_points_next_n_gameweeks(5)
+    # Fetch players and expected points for next 5 gameweeks concurrently
+    all_players, expected_points_map = await asyncio.gather(
+        player_service.get_all_players(
+            position=position,
+            team_id=team_id,
+            min_cost=min_cost,
+            max_cost=max_cost,
+        ),
+        expected_points_service.calculate_expected_points_next_n_gameweeks(5),
+    )
 
-    # Build response with expected points
+    # Build response with expected points; players without a projection
+    # share one read-only default instead of allocating a list each
+    default_expected_points = [1.0] * 5
     players_with_fixtures = []
 
     for player in all_players:
         player_id = player.id
-        expected_points = expected_points_map.get(player_id, [1.0, 1.0, 1.0, 1.0, 1.0])
+        expected_points = expected_points_map.get(player_id, default_expected_points)
 
-        # Ensure we have exactly 5 values
-        while len(expected_points) < 5:
-            expected_points.append(1.0)
+        # Ensure we have exactly 5 values (pad a copy; the map is shared)
+        if len(expected_points) < 5:
+            expected_points = expected_points + [1.0] * (5 - len(expected_points))
 
-        player_with_fixtures = PlayerWithFixtures(
+        # Fields come from an already validated Player, so skip re-validation
+        player_with_fixtures = PlayerWithFixtures.model_construct(
             id=player.id,
             web_name=player.web_name,
             first_name=player.first_name,
@@ -219,10 +244,12 @@ async def get_players_with_upcoming_fixtures(
 
         players_with_fixtures.append(player_with_fixtures)
 
-    logger.info(f"Retrieved {len(players_with_fixtures)} players with fixture data")
+    logger.info("Retrieved %s players with fixture data", len(players_with_fixtures))
 
-    return BaseResponse(
-        success=True,
-        message=f"Retrieved {len(players_with_fixtures)} players with upcoming fixtures successfully",
-        data=players_with_fixtures,
+    return model_json_response(
+        PlayersWithFixturesResponse.model_construct(
+            success=True,
+            message=f"Retrieved {len(players_with_fixtures)} players with upcoming fixtures successfully",
+            data=players_with_fixtures,
+        )
     )
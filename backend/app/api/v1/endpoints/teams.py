@@ -1,17 +1,19 @@
 """Team endpoints."""
 
 import logging
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, Response
 
 from app.api.dependencies import TeamServiceDep, TransferSolverServiceDep
+from app.api.model_response import model_json_response
 from app.schemas.responses import (
     TeamResponse,
-    BaseResponse,
+    TeamSummaryResponse,
     TransferPlanResponse,
     TransferPlanData,
     WeeklyTransferSolution,
     TransferRecommendation,
 )
+from app.schemas.examples import TEAM_RESPONSE_EXAMPLE, example_response
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,7 @@ router = APIRouter()
     summary="Get Team by ID",
     description="Retrieve FPL team data by team entry ID",
     tags=["Teams"],
+    responses=example_response(TEAM_RESPONSE_EXAMPLE),
 )
 async def get_team(
     team_id: int,
@@ -32,7 +35,7 @@ async def get_team(
     include_picks: bool = Query(
         True, description="Include current team picks (starting XI and bench)"
     ),
-) -> TeamResponse:
+) -> Response:
     """Get FPL team by ID.
 
     Args:
@@ -43,20 +46,22 @@ async def get_team(
     Returns:
         Team data with optional picks
     """
-    logger.info(f"GET /teams/{team_id}?include_picks={include_picks}")
+    logger.info("GET /teams/%s?include_picks=%s", team_id, include_picks)
 
     team = await team_service.get_team_by_id(team_id, include_picks=include_picks)
 
-    return TeamResponse(
-        success=True,
-        message=f"Team {team_id} retrieved successfully",
-        data=team,
+    return model_json_response(
+        TeamResponse.model_construct(
+            success=True,
+            message=f"Team {team_id} retrieved successfully",
+            data=team,
+        )
     )
 
 
 @router.get(
     "/teams/{team_id}/summary",
-    response_model=BaseResponse[dict],
+    response_model=TeamSummaryResponse,
     response_model_by_alias=False,  # Use field names, not aliases
     summary="Get Team Summary",
     description="Get team summary with key statistics",
@@ -65,7 +70,7 @@ async def get_team(
 async def get_team_summary(
     team_id: int,
     team_service: TeamServiceDep,
-) -> BaseResponse[dict]:
+) -> Response:
     """Get team summary with key statistics.
 
     Args:
@@ -75,14 +80,16 @@ async def get_team_summary(
     Returns:
         Team summary with key statistics
     """
-    logger.info(f"GET /teams/{team_id}/summary")
+    logger.info("GET /teams/%s/summary", team_id)
 
     summary = await team_service.get_team_summary(team_id)
 
-    return BaseResponse(
-        success=True,
-        message=f"Team {team_id} summary retrieved successfully",
-        data=summary,
+    return model_json_response(
+        TeamSummaryResponse.model_construct(
+            success=True,
+            message=f"Team {team_id} summary retrieved successfully",
+            data=summary,
+        )
     )
 
 
@@ -100,7 +107,7 @@ async def generate_transfer_plan(
     transfer_solver_service: TransferSolverServiceDep,
     num_gameweeks: int = Query(5, ge=1, le=10, description="Number of gameweeks to optimize"),
     discount_factor: float = Query(0.9, ge=0.5, le=1.0, description="Discount factor for future gameweeks"),
-) -> TransferPlanResponse:
+) -> Response:
     """Generate optimal transfer plan for N gameweeks.
 
     Args:
@@ -129,8 +136,9 @@ async def generate_transfer_plan(
         free_transfers = team.transfers.get("free_transfers", 1)
 
     logger.info(
-        f"POST /teams/{team_id}/transfer-plan?num_gameweeks={num_gameweeks}&"
-        f"free_transfers={free_transfers}&discount_factor={discount_factor}"
+        "POST /teams/%s/transfer-plan?num_gameweeks=%s&"
+        "free_transfers=%s&discount_factor=%s",
+        team_id, num_gameweeks, free_transfers, discount_factor
     )
 
     # Calculate budget (bank in millions)
@@ -145,12 +153,13 @@ async def generate_transfer_plan(
         discount_factor=discount_factor,
     )
 
-    # Convert to response format
+    # Convert to response format. The solver output is already typed, so
+    # build the models without re-validating each record.
     weekly_solutions = [
-        WeeklyTransferSolution(
+        WeeklyTransferSolution.model_construct(
             gameweek=sol.gameweek,
-            transfers_in=[TransferRecommendation(**t) for t in sol.transfers_in],
-            transfers_out=[TransferRecommendation(**t) for t in sol.transfers_out],
+            transfers_in=[TransferRecommendation.model_construct(**t) for t in sol.transfers_in],
+            transfers_out=[TransferRecommendation.model_construct(**t) for t in sol.transfers_out],
             expected_points=sol.expected_points,
             transfer_cost=sol.transfer_cost,
             free_transfers_used=sol.free_transfers_used,
@@ -162,7 +171,7 @@ async def generate_transfer_plan(
     # FPL API current_event is the last completed gameweek, so add 1 for next gameweek
     next_gameweek = team.current_event + 1
 
-    plan_data = TransferPlanData(
+    plan_data = TransferPlanData.model_construct(
         current_gameweek=next_gameweek,
         weekly_solutions=weekly_solutions,
         total_expected_points=transfer_plan.total_expected_points,
@@ -171,8 +180,10 @@ async def generate_transfer_plan(
         improvement=transfer_plan.improvement,
     )
 
-    return TransferPlanResponse(
-        success=True,
-        message=f"Transfer plan generated for {num_gameweeks} gameweeks",
-        data=plan_data,
+    return model_json_response(
+        TransferPlanResponse.model_construct(
+            success=True,
+            message=f"Transfer plan generated for {num_gameweeks} gameweeks",
+            data=plan_data,
+        )
     )
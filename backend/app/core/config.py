@@ -41,12 +41,18 @@ class Settings(BaseSettings):
     )
     fpl_api_timeout: int = Field(default=30, alias="FPL_API_TIMEOUT")
     fpl_api_max_retries: int = Field(default=3, alias="FPL_API_MAX_RETRIES")
+    fpl_api_max_connections: int = Field(default=100, alias="FPL_API_MAX_CONNECTIONS")
+    fpl_api_max_keepalive_connections: int = Field(
+        default=20, alias="FPL_API_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    fpl_api_keepalive_expiry: float = Field(default=60.0, alias="FPL_API_KEEPALIVE_EXPIRY")
 
     # Redis
     redis_host: str = Field(default="localhost", alias="REDIS_HOST")
     redis_port: int = Field(default=6379, alias="REDIS_PORT")
     redis_db: int = Field(default=0, alias="REDIS_DB")
     redis_cache_ttl: int = Field(default=300, alias="REDIS_CACHE_TTL")
+    redis_socket_timeout: float = Field(default=1.0, alias="REDIS_SOCKET_TIMEOUT")
 
     # CORS
     cors_origins: Union[List[str], str] = Field(
@@ -20,11 +20,16 @@ class Container(containers.DeclarativeContainer):
     # Configuration
     config = providers.Singleton(lambda: settings)
 
-    # HTTP Client
+    # HTTP Client (one pooled keep-alive client for the app lifetime)
     http_client = providers.Singleton(
         httpx.AsyncClient,
         timeout=settings.fpl_api_timeout,
         follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=settings.fpl_api_max_connections,
+            max_keepalive_connections=settings.fpl_api_max_keepalive_connections,
+            keepalive_expiry=settings.fpl_api_keepalive_expiry,
+        ),
     )
 
     # Infrastructure
@@ -39,6 +44,7 @@ class Container(containers.DeclarativeContainer):
         RedisCache,
         redis_url=settings.redis_url,
         ttl=settings.redis_cache_ttl,
+        socket_timeout=settings.redis_socket_timeout,
     )
 
     # Services (defined before repositories that depend on them)
@@ -11,6 +11,11 @@ from app.core.config import settings
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """Custom JSON formatter with additional fields."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the formatter and resolve the per-app fields once."""
+        super().__init__(*args, **kwargs)
+        self._app_fields = {"app": settings.app_name, "environment": settings.environment}
+
     def add_fields(
         self,
         log_record: Dict[str, Any],
@@ -21,8 +26,7 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
         super().add_fields(log_record, record, message_dict)
         log_record["level"] = record.levelname
         log_record["logger"] = record.name
-        log_record["app"] = settings.app_name
-        log_record["environment"] = settings.environment
+        log_record.update(self._app_fields)
 
 
 def setup_logging() -> None:
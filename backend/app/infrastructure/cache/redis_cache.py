@@ -1,8 +1,8 @@
 """Redis cache implementation."""
 
-import json
 import logging
 from typing import Any, Optional
+import orjson
 import redis.asyncio as redis
 
 from app.core.exceptions import CacheException
@@ -13,29 +13,37 @@ logger = logging.getLogger(__name__)
 class RedisCache:
     """Redis cache implementation with async support."""
 
-    def __init__(self, redis_url: str, ttl: int = 300):
+    def __init__(self, redis_url: str, ttl: int = 300, socket_timeout: float = 1.0):
         """Initialize Redis cache.
 
         Args:
             redis_url: Redis connection URL
             ttl: Default time-to-live in seconds
+            socket_timeout: Connect and per-command timeout in seconds
         """
         self.redis_url = redis_url
         self.ttl = ttl
+        self.socket_timeout = socket_timeout
         self._client: Optional[redis.Redis] = None
 
     async def connect(self) -> None:
         """Connect to Redis."""
         try:
+            # Keep raw bytes from Redis: orjson decodes bytes directly and
+            # get_bytes() can hand pre-serialized payloads through untouched
+            # Bound every command so a stalled Redis degrades to a cache
+            # miss instead of hanging the request
             self._client = redis.from_url(
                 self.redis_url,
                 encoding="utf-8",
-                decode_responses=True,
+                decode_responses=False,
+                socket_timeout=self.socket_timeout,
+                socket_connect_timeout=self.socket_timeout,
             )
             await self._client.ping()
             logger.info("Successfully connected to Redis")
         except Exception as e:
-            logger.warning(f"Failed to connect to Redis: {e}. Cache will be disabled.")
+            logger.warning("Failed to connect to Redis: %s. Cache will be disabled.", e)
             self._client = None
 
     async def disconnect(self) -> None:
@@ -59,12 +67,12 @@ class RedisCache:
         try:
             value = await self._client.get(key)
             if value:
-                logger.debug(f"Cache hit for key: {key}")
-                return json.loads(value)
-            logger.debug(f"Cache miss for key: {key}")
+                logger.debug("Cache hit for key: %s", key)
+                return orjson.loads(value)
+            logger.debug("Cache miss for key: %s", key)
             return None
         except Exception as e:
-            logger.error(f"Error getting cache key {key}: {e}")
+            logger.error("Error getting cache key %s: %s", key, e)
             return None
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
@@ -82,13 +90,61 @@ class RedisCache:
             return False
 
         try:
-            serialized_value = json.dumps(value)
+            # Non-str keys (e.g. int player IDs) are written as strings
+            serialized_value = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
             cache_ttl = ttl if ttl is not None else self.ttl
             await self._client.setex(key, cache_ttl, serialized_value)
-            logger.debug(f"Cached key: {key} with TTL: {cache_ttl}s")
+            # Size comes from the buffer we already encoded, not a second dump
+            logger.debug("Cached key: %s (%s bytes) with TTL: %ss", key, len(serialized_value), cache_ttl)
             return True
         except Exception as e:
-            logger.error(f"Error setting cache key {key}: {e}")
+            logger.error("Error setting cache key %s: %s", key, e)
+            return False
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """Get a pre-serialized value from cache without decoding it.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Raw cached bytes or None if not found
+        """
+        if not self._client:
+            return None
+
+        try:
+            value = await self._client.get(key)
+            if value:
+                logger.debug("Cache hit for key: %s", key)
+                return value
+            logger.debug("Cache miss for key: %s", key)
+            return None
+        except Exception as e:
+            logger.error("Error getting cache key %s: %s", key, e)
+            return None
+
+    async def set_bytes(self, key: str, value: bytes, ttl: Optional[int] = None) -> bool:
+        """Set a pre-serialized value in cache as-is.
+
+        Args:
+            key: Cache key
+            value: Already-encoded payload
+            ttl: Time-to-live in seconds (uses default if not specified)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._client:
+            return False
+
+        try:
+            cache_ttl = ttl if ttl is not None else self.ttl
+            await self._client.setex(key, cache_ttl, value)
+            logger.debug("Cached key: %s (%s bytes) with TTL: %ss", key, len(value), cache_ttl)
+            return True
+        except Exception as e:
+            logger.error("Error setting cache key %s: %s", key, e)
             return False
 
     async def delete(self, key: str) -> bool:
@@ -105,10 +161,10 @@ class RedisCache:
 
         try:
             await self._client.delete(key)
-            logger.debug(f"Deleted cache key: {key}")
+            logger.debug("Deleted cache key: %s", key)
             return True
         except Exception as e:
-            logger.error(f"Error deleting cache key {key}: {e}")
+            logger.error("Error deleting cache key %s: %s", key, e)
             return False
 
     async def clear(self) -> bool:
@@ -125,5 +181,5 @@ class RedisCache:
             logger.info("Cleared all cache entries")
             return True
         except Exception as e:
-            logger.error(f"Error clearing cache: {e}")
+            logger.error("Error clearing cache: %s", e)
             return False
\ No newline at end of file
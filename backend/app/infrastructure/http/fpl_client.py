@@ -1,8 +1,11 @@
 """FPL API HTTP client with retry logic."""
 
+import asyncio
 import logging
-from typing import Any, Dict
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from app.core.exceptions import ExternalAPIException
@@ -13,6 +16,15 @@ logger = logging.getLogger(__name__)
 class FPLClient:
     """HTTP client for Fantasy Premier League API."""
 
+    # Upper bound on concurrent requests issued by batch helpers
+    MAX_CONCURRENT_REQUESTS = 20
+
+    # After an outage-type failure, fail fast for this long (seconds)
+    FAILURE_BACKOFF_SECONDS = 10
+
+    # Serve the last bootstrap-static payload without revalidating for this long (seconds)
+    BOOTSTRAP_FRESH_SECONDS = 5
+
     def __init__(self, client: httpx.AsyncClient, base_url: str, max_retries: int = 3):
         """Initialize FPL client.
 
@@ -24,6 +36,18 @@ class FPLClient:
         self.client = client
         self.base_url = base_url.rstrip("/")
         self.max_retries = max_retries
+        self._batch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        # Last bootstrap-static payload and its ETag for conditional requests
+        self._bootstrap_etag: Optional[str] = None
+        self._bootstrap_data: Optional[Dict[str, Any]] = None
+        self._bootstrap_fetched_at = 0.0
+
+        # Monotonic deadline until which requests fail without hitting the network
+        self._fail_until = 0.0
+
+        # Requests currently in flight by endpoint, shared by concurrent callers
+        self._in_flight: Dict[str, asyncio.Task] = {}
 
     @retry(
         stop=stop_after_attempt(3),
@@ -31,53 +55,162 @@ class FPLClient:
         retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
         reraise=True,
     )
-    async def get(self, endpoint: str) -> Dict[str, Any]:
+    async def _get_response(
+        self, endpoint: str, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
         """Make GET request to FPL API with retry logic.
 
+        A 304 Not Modified response is returned as-is for conditional requests.
+
         Args:
             endpoint: API endpoint (without base URL)
+            headers: Optional extra request headers
 
         Returns:
-            JSON response as dictionary
+            Successful (2xx or 304) HTTP response
 
         Raises:
             ExternalAPIException: If request fails after retries
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        logger.info(f"Making request to FPL API: {url}")
+
+        if time.monotonic() < self._fail_until:
+            logger.warning("Skipping request to FPL API during backoff: %s", url)
+            raise ExternalAPIException("FPL API is temporarily unavailable")
+
+        logger.info("Making request to FPL API: %s", url)
 
         try:
-            response = await self.client.get(url)
+            response = await self.client.get(url, headers=headers)
+            if response.status_code == httpx.codes.NOT_MODIFIED:
+                logger.info("FPL API data not modified: %s", url)
+                return response
             response.raise_for_status()
-            data = response.json()
-            logger.info(f"Successfully retrieved data from: {url}")
-            return data
+            logger.info("Successfully retrieved data from: %s", url)
+            return response
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error from FPL API: {e.response.status_code} - {url}")
+            logger.error("HTTP error from FPL API: %s - %s", e.response.status_code, url)
+            if e.response.status_code >= 500:
+                self._start_backoff()
             raise ExternalAPIException(
                 f"FPL API returned error: {e.response.status_code}"
             ) from e
 
         except httpx.TimeoutException as e:
-            logger.error(f"Timeout requesting FPL API: {url}")
+            logger.error("Timeout requesting FPL API: %s", url)
+            self._start_backoff()
             raise ExternalAPIException("FPL API request timed out") from e
 
         except httpx.NetworkError as e:
-            logger.error(f"Network error requesting FPL API: {url}")
+            logger.error("Network error requesting FPL API: %s", url)
+            self._start_backoff()
             raise ExternalAPIException("Network error connecting to FPL API") from e
 
         except Exception as e:
-            logger.error(f"Unexpected error requesting FPL API: {url} - {str(e)}")
+            logger.error("Unexpected error requesting FPL API: %s - %s", url, e)
+            raise ExternalAPIException(f"Unexpected error: {str(e)}") from e
+
+    def _start_backoff(self) -> None:
+        """Suppress further FPL requests for FAILURE_BACKOFF_SECONDS."""
+        self._fail_until = time.monotonic() + self.FAILURE_BACKOFF_SECONDS
+
+    async def _coalesce(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Share one in-flight request between concurrent callers.
+
+        Callers asking for the same key while a request is pending await
+        that request instead of issuing their own. Results are not kept
+        once the request completes.
+
+        Args:
+            key: Request key (endpoint)
+            fetch: Coroutine function performing the request
+
+        Returns:
+            Result of the shared request
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the others
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _decode(response: httpx.Response) -> Any:
+        """Decode a JSON response body.
+
+        Args:
+            response: Successful HTTP response
+
+        Returns:
+            Decoded JSON payload
+
+        Raises:
+            ExternalAPIException: If the body is not valid JSON
+        """
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid JSON from FPL API: %s - %s", response.url, e)
             raise ExternalAPIException(f"Unexpected error: {str(e)}") from e
 
+    async def get(self, endpoint: str) -> Dict[str, Any]:
+        """Make GET request to FPL API and decode the JSON body.
+
+        Concurrent requests for the same endpoint share one upstream call.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+
+        Returns:
+            JSON response as dictionary
+
+        Raises:
+            ExternalAPIException: If request fails after retries
+        """
+        return await self._coalesce(endpoint, lambda: self._fetch(endpoint))
+
+    async def _fetch(self, endpoint: str) -> Dict[str, Any]:
+        """Request an endpoint and decode the JSON body."""
+        response = await self._get_response(endpoint)
+        return self._decode(response)
+
     async def get_bootstrap_static(self) -> Dict[str, Any]:
         """Get bootstrap-static data (all players, teams, gameweeks).
 
+        Sends If-None-Match with the last ETag so an unchanged payload is
+        answered with 304 and the previous data is reused without a download.
+        Concurrent callers share one upstream call, and a payload younger
+        than BOOTSTRAP_FRESH_SECONDS is returned without any request.
+
         Returns:
             Bootstrap static data containing players, teams, events, etc.
         """
-        return await self.get("/bootstrap-static/")
+        if (
+            self._bootstrap_data is not None
+            and time.monotonic() - self._bootstrap_fetched_at < self.BOOTSTRAP_FRESH_SECONDS
+        ):
+            return self._bootstrap_data
+        return await self._coalesce("/bootstrap-static/", self._fetch_bootstrap_static)
+
+    async def _fetch_bootstrap_static(self) -> Dict[str, Any]:
+        """Request bootstrap-static, revalidating against the last ETag."""
+        headers = None
+        if self._bootstrap_etag and self._bootstrap_data is not None:
+            headers = {"If-None-Match": self._bootstrap_etag}
+
+        response = await self._get_response("/bootstrap-static/", headers=headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED and self._bootstrap_data is not None:
+            self._bootstrap_fetched_at = time.monotonic()
+            return self._bootstrap_data
+
+        data = self._decode(response)
+        self._bootstrap_etag = response.headers.get("ETag")
+        self._bootstrap_data = data
+        self._bootstrap_fetched_at = time.monotonic()
+        return data
 
     async def get_entry(self, entry_id: int) -> Dict[str, Any]:
         """Get team entry data.
@@ -143,6 +276,25 @@ class FPLClient:
         """
         return await self.get(f"/element-summary/{element_id}/")
 
+    async def get_element_summaries(self, element_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get summaries for several players concurrently.
+
+        Requests share the client's keep-alive pool and are capped at
+        MAX_CONCURRENT_REQUESTS in flight to respect FPL rate limits.
+
+        Args:
+            element_ids: Player element IDs
+
+        Returns:
+            Player summaries in the same order as element_ids
+        """
+
+        async def fetch(element_id: int) -> Dict[str, Any]:
+            async with self._batch_semaphore:
+                return await self.get_element_summary(element_id)
+
+        return await asyncio.gather(*(fetch(element_id) for element_id in element_ids))
+
     async def get_entry_history(self, entry_id: int) -> Dict[str, Any]:
         """Get team's gameweek-by-gameweek history.
 
@@ -1,25 +1,61 @@
 """Main FastAPI application entry point."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.core.container import container
 from app.api.v1.router import api_router
+from app.api.orjson_response import ORJSONResponse
 from app.api.middleware import (
     LoggingMiddleware,
     ErrorHandlingMiddleware,
     CORSSecurityMiddleware,
+    HealthProbeMiddleware,
 )
 
 # Setup logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Root payload never changes at runtime, so encode it once at import
+_ROOT_JSON = orjson.dumps(
+    {
+        "message": f"Welcome to {settings.app_name}",
+        "version": settings.app_version,
+        "docs": "/docs",
+        "health": f"{settings.api_v1_prefix}/health",
+    }
+)
+
+
+async def _warm_cache() -> None:
+    """Prefetch FPL data so the first user request hits a warm cache.
+
+    Player models and expected points are built concurrently; failures are
+    logged and left for the first request to retry.
+    """
+    player_repository = container.player_repository()
+    expected_points_service = container.expected_points_service()
+
+    results = await asyncio.gather(
+        player_repository.get_all_players(),
+        expected_points_service.calculate_expected_points_for_all_players(),
+        return_exceptions=True,
+    )
+
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("Cache warm-up failed: %s", result)
+            return
+
+    logger.info("Cache warm-up completed")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -32,8 +68,8 @@ async def lifespan(app: FastAPI):
         None
     """
     # Startup
-    logger.info(f"Starting {settings.app_name} v{settings.app_version}")
-    logger.info(f"Environment: {settings.environment}")
+    logger.info("Starting %s v%s", settings.app_name, settings.app_version)
+    logger.info("Environment: %s", settings.environment)
 
     # Initialize Redis cache
     try:
@@ -41,20 +77,26 @@ async def lifespan(app: FastAPI):
         await redis_cache.connect()
         logger.info("Redis cache initialized successfully")
     except Exception as e:
-        logger.warning(f"Failed to initialize Redis cache: {e}. Continuing without cache.")
+        logger.warning("Failed to initialize Redis cache: %s. Continuing without cache.", e)
+
+    # Warm FPL caches in the background so startup is not blocked
+    warm_cache_task = asyncio.create_task(_warm_cache())
 
     yield
 
     # Shutdown
     logger.info("Shutting down application")
 
+    if not warm_cache_task.done():
+        warm_cache_task.cancel()
+
     # Close Redis connection
     try:
         redis_cache = container.redis_cache()
         await redis_cache.disconnect()
         logger.info("Redis cache disconnected")
     except Exception as e:
-        logger.error(f"Error disconnecting Redis: {e}")
+        logger.error("Error disconnecting Redis: %s", e)
 
     # Close HTTP client
     try:
@@ -62,7 +104,7 @@ async def lifespan(app: FastAPI):
         await http_client.aclose()
         logger.info("HTTP client closed")
     except Exception as e:
-        logger.error(f"Error closing HTTP client: {e}")
+        logger.error("Error closing HTTP client: %s", e)
 
 
 # Create FastAPI application
@@ -74,6 +116,8 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    # Encode route responses with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -90,6 +134,9 @@ app.add_middleware(CORSSecurityMiddleware)
 app.add_middleware(ErrorHandlingMiddleware)
 app.add_middleware(LoggingMiddleware)
 
+# Outermost, so liveness probes skip the rest of the stack
+app.add_middleware(HealthProbeMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 
@@ -98,14 +145,7 @@ app.include_router(api_router, prefix=settings.api_v1_prefix)
 @app.get("/", include_in_schema=False)
 async def root():
     """Root endpoint redirecting to docs."""
-    return JSONResponse(
-        content={
-            "message": f"Welcome to {settings.app_name}",
-            "version": settings.app_version,
-            "docs": "/docs",
-            "health": f"{settings.api_v1_prefix}/health",
-        }
-    )
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 
 if __name__ == "__main__":
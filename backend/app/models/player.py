@@ -1,12 +1,15 @@
 """Player domain model."""
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class Player(BaseModel):
     """FPL Player domain model."""
 
+    # Frozen: instances are shared from the repository cache without copies
+    model_config = ConfigDict(from_attributes=True, extra="ignore", frozen=True)
+
     id: int = Field(..., description="Unique player ID")
     web_name: str = Field(..., description="Player web name (short name)")
     first_name: str = Field(..., description="Player first name")
@@ -18,9 +21,9 @@ class Player(BaseModel):
     now_cost: int = Field(..., description="Current cost in £0.1m units")
     cost_change_start: int = Field(..., description="Cost change from start in £0.1m")
     total_points: int = Field(..., description="Total points scored this season")
-    points_per_game: str = Field(..., description="Average points per game")
-    form: str = Field(..., description="Recent form rating")
-    selected_by_percent: str = Field(..., description="Percentage of teams selecting player")
+    points_per_game: float = Field(..., description="Average points per game")
+    form: float = Field(..., description="Recent form rating")
+    selected_by_percent: float = Field(..., description="Percentage of teams selecting player")
     minutes: int = Field(..., description="Minutes played")
     goals_scored: int = Field(..., description="Goals scored")
     assists: int = Field(..., description="Assists")
@@ -34,36 +37,14 @@ class Player(BaseModel):
     saves: int = Field(..., description="Saves")
     bonus: int = Field(..., description="Bonus points")
     bps: int = Field(..., description="Bonus points system score")
-    influence: str = Field(..., description="Influence rating")
-    creativity: str = Field(..., description="Creativity rating")
-    threat: str = Field(..., description="Threat rating")
-    ict_index: str = Field(..., description="ICT index (combined influence/creativity/threat)")
-    expected_goals: str = Field(..., description="Expected goals (xG)")
-    expected_assists: str = Field(..., description="Expected assists (xA)")
-    expected_goal_involvements: str = Field(..., description="Expected goal involvements (xGI)")
-    expected_goals_conceded: str = Field(..., description="Expected goals conceded (xGC)")
+    influence: float = Field(..., description="Influence rating")
+    creativity: float = Field(..., description="Creativity rating")
+    threat: float = Field(..., description="Threat rating")
+    ict_index: float = Field(..., description="ICT index (combined influence/creativity/threat)")
+    expected_goals: float = Field(..., description="Expected goals (xG)")
+    expected_assists: float = Field(..., description="Expected assists (xA)")
+    expected_goal_involvements: float = Field(..., description="Expected goal involvements (xGI)")
+    expected_goals_conceded: float = Field(..., description="Expected goals conceded (xGC)")
     status: str = Field(..., description="Availability status (a=available, d=doubtful, i=injured, etc.)")
     news: str = Field(default="", description="Latest player news")
     chance_of_playing_next_round: Optional[int] = Field(None, description="Chance of playing percentage")
-
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "web_name": "Salah",
-                "first_name": "Mohamed",
-                "second_name": "Salah",
-                "team": 10,
-                "team_name": "Liverpool",
-                "element_type": 3,
-                "position": "Midfielder",
-                "now_cost": 130,
-                "total_points": 245,
-                "form": "7.5",
-                "selected_by_percent": "45.2",
-                "status": "a",
-            }
-        }
@@ -0,0 +1,127 @@
+"""Player list filter model."""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, List, Optional
+
+from app.models.player import Player
+
+PlayerPredicate = Callable[[Player], bool]
+
+# FPL position names by element type, used to filter on the integer field
+POSITION_ELEMENT_TYPES = {
+    "Goalkeeper": 1,
+    "Defender": 2,
+    "Midfielder": 3,
+    "Forward": 4,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerFilters:
+    """Filters applied to the player list.
+
+    Costs are held in FPL's 0.1m units so they compare directly against
+    ``Player.now_cost``.
+    """
+
+    position: Optional[str] = None
+    team_id: Optional[int] = None
+    min_cost: Optional[int] = None
+    max_cost: Optional[int] = None
+
+    @classmethod
+    def from_query(
+        cls,
+        position: Optional[str] = None,
+        team_id: Optional[int] = None,
+        min_cost: Optional[float] = None,
+        max_cost: Optional[float] = None,
+    ) -> "PlayerFilters":
+        """Build filters from API query values.
+
+        Args:
+            position: Position name
+            team_id: Team ID
+            min_cost: Minimum cost in millions
+            max_cost: Maximum cost in millions
+
+        Returns:
+            Normalized filters (empty values become None)
+        """
+        return cls(
+            position=position or None,
+            team_id=team_id or None,
+            min_cost=int(min_cost * 10) if min_cost is not None else None,
+            max_cost=int(max_cost * 10) if max_cost is not None else None,
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether no filter is set."""
+        return (
+            self.position is None
+            and self.team_id is None
+            and self.min_cost is None
+            and self.max_cost is None
+        )
+
+    @property
+    def is_unsatisfiable(self) -> bool:
+        """Whether the cost range is empty, so no player can match."""
+        return (
+            self.min_cost is not None
+            and self.max_cost is not None
+            and self.min_cost > self.max_cost
+        )
+
+    def predicate(self) -> PlayerPredicate:
+        """Get a predicate that only tests the filters that are set.
+
+        Predicates are memoized per filter value, so repeated queries reuse
+        the one built for the first.
+
+        Returns:
+            Callable returning True for players matching every set filter
+        """
+        return _build_predicate(self)
+
+
+@lru_cache(maxsize=256)
+def _build_predicate(filters: PlayerFilters) -> PlayerPredicate:
+    """Build the predicate for a set of filters."""
+    checks: List[PlayerPredicate] = []
+    if filters.position is not None:
+        element_type = POSITION_ELEMENT_TYPES.get(filters.position)
+        if element_type is not None:
+            checks.append(lambda p: p.element_type == element_type)
+        else:
+            # Unknown to the table: fall back to matching the name
+            position = filters.position
+            checks.append(lambda p: p.position == position)
+    if filters.team_id is not None:
+        team_id = filters.team_id
+        checks.append(lambda p: p.team == team_id)
+    if filters.min_cost is not None and filters.max_cost is not None:
+        min_cost, max_cost = filters.min_cost, filters.max_cost
+        checks.append(lambda p: min_cost <= p.now_cost <= max_cost)
+    elif filters.min_cost is not None:
+        min_cost = filters.min_cost
+        checks.append(lambda p: p.now_cost >= min_cost)
+    elif filters.max_cost is not None:
+        max_cost = filters.max_cost
+        checks.append(lambda p: p.now_cost <= max_cost)
+
+    if not checks:
+        return lambda p: True
+
+    # Chain the checks so each player runs only the tests that apply
+    match = checks[0]
+    for check in checks[1:]:
+        match = _both(match, check)
+    return match
+
+
+def _both(first: PlayerPredicate, second: PlayerPredicate) -> PlayerPredicate:
+    """Combine two predicates with short-circuit AND."""
+    return lambda p: first(p) and second(p)
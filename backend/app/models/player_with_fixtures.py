@@ -1,12 +1,14 @@
 """Player with fixture difficulty model."""
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class PlayerWithFixtures(BaseModel):
     """Player with expected points for upcoming fixtures."""
 
+    model_config = ConfigDict(from_attributes=True, extra="ignore", frozen=True)
+
     id: int = Field(..., description="Unique player ID")
     web_name: str = Field(..., description="Player web name (short name)")
     first_name: str = Field(..., description="Player first name")
@@ -17,8 +19,8 @@ class PlayerWithFixtures(BaseModel):
     position: Optional[str] = Field(None, description="Position name")
     now_cost: int = Field(..., description="Current cost in £0.1m units")
     total_points: int = Field(..., description="Total points scored this season")
-    form: str = Field(..., description="Recent form rating")
-    selected_by_percent: str = Field(..., description="Percentage of teams selecting player")
+    form: float = Field(..., description="Recent form rating")
+    selected_by_percent: float = Field(..., description="Percentage of teams selecting player")
     minutes: int = Field(..., description="Minutes played")
     status: str = Field(..., description="Availability status (a=available, d=doubtful, i=injured, etc.)")
     news: str = Field(default="", description="Latest player news")
@@ -31,8 +33,3 @@ class PlayerWithFixtures(BaseModel):
     expected_points_gw4: float = Field(..., description="Expected points for GW+4")
     expected_points_gw5: float = Field(..., description="Expected points for GW+5")
     expected_points_total: float = Field(..., description="Total expected points over 5 GWs")
-
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
\ No newline at end of file
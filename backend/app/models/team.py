@@ -1,7 +1,7 @@
 """Team domain model."""
 
 from typing import List, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, SkipValidation
 
 from app.models.team_pick import TeamPick
 
@@ -34,6 +34,9 @@ class Team(BaseModel):
     team_value: int = Field(..., alias="last_deadline_value", description="Team value in £0.1m units")
 
     # Transfers structure from FPL API
-    transfers: Optional[dict] = Field(None, description="Transfer information including free transfers")
+    # Built internally from FPL history; skip copying the dict on validation
+    transfers: Optional[SkipValidation[dict]] = Field(
+        None, description="Transfer information including free transfers"
+    )
 
     picks: Optional[List[TeamPick]] = Field(None, description="Current team picks")
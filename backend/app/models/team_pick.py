@@ -1,12 +1,14 @@
 """Team pick domain model."""
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class TeamPick(BaseModel):
     """Team player pick."""
 
+    model_config = ConfigDict(from_attributes=True, extra="ignore", frozen=True)
+
     element: int = Field(..., description="Player ID")
     position: int = Field(..., description="Position in team (1-15)")
     multiplier: int = Field(..., description="Point multiplier (0=bench, 1=playing, 2=captain, 3=vice)")
@@ -25,23 +27,3 @@ class TeamPick(BaseModel):
     player_cost: Optional[int] = Field(None, description="Player current cost in £0.1m units")
     purchase_price: Optional[int] = Field(None, description="Player purchase price in £0.1m units")
     expected_points: Optional[float] = Field(None, description="Expected points for next gameweek")
-
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "element": 1,
-                "position": 1,
-                "multiplier": 2,
-                "is_captain": True,
-                "is_vice_captain": False,
-                "player_name": "Salah",
-                "player_first_name": "Mohamed",
-                "player_second_name": "Salah",
-                "player_team": 10,
-                "player_position": 3,
-                "player_cost": 130,
-            }
-        }
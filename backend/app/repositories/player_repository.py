@@ -1,7 +1,11 @@
 """Player repository for accessing FPL player data."""
 
+import asyncio
 import logging
-from typing import List, Optional
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pydantic import TypeAdapter
 
 from app.infrastructure.http.fpl_client import FPLClient
 from app.infrastructure.cache.redis_cache import RedisCache
@@ -10,12 +14,34 @@ from app.core.exceptions import NotFoundException
 
 logger = logging.getLogger(__name__)
 
+_PLAYERS_ADAPTER = TypeAdapter(List[Player])
+
 
 class PlayerRepository:
     """Repository for FPL player data."""
 
     CACHE_KEY_ALL_PLAYERS = "fpl:players:all"
-    CACHE_KEY_PLAYER = "fpl:player:{player_id}"
+
+    # In-process cache in front of Redis (seconds). Past the soft TTL the
+    # snapshot is still served while a background refresh runs; past the
+    # hard TTL callers wait for a refresh.
+    LOCAL_CACHE_TTL = 60
+    LOCAL_CACHE_HARD_TTL = 300
+
+    # FPL returns these as numeric strings; parse them once at ingest
+    NUMERIC_FIELDS = (
+        "points_per_game",
+        "form",
+        "selected_by_percent",
+        "influence",
+        "creativity",
+        "threat",
+        "ict_index",
+        "expected_goals",
+        "expected_assists",
+        "expected_goal_involvements",
+        "expected_goals_conceded",
+    )
 
     def __init__(self, fpl_client: FPLClient, cache: RedisCache):
         """Initialize player repository.
@@ -26,79 +52,169 @@ class PlayerRepository:
         """
         self.fpl_client = fpl_client
         self.cache = cache
-
-    async def get_all_players(self) -> List[Player]:
+        # Immutable snapshot shared by all callers, plus an ID index over it
+        self._players_l1: Optional[Tuple[float, Tuple[Player, ...]]] = None
+        self._players_by_id: Dict[int, Player] = {}
+        # JSON encoding of the current snapshot, built on first use
+        self._players_json: Optional[Tuple[Tuple[Player, ...], bytes]] = None
+        # Serializes cache-miss refreshes so concurrent callers share one load
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        # Team/position name lookups, rebuilt only when the gameweek changes
+        self._teams_lookup: Dict[int, str] = {}
+        self._position_lookup: Dict[int, str] = {}
+        self._lookups_event: Optional[int] = None
+
+    async def get_all_players(self) -> Tuple[Player, ...]:
         """Get all available FPL players.
 
+        The returned tuple is shared across callers and must not be mutated.
+
         Returns:
-            List of all players
+            Tuple of all players
 
         Raises:
             ExternalAPIException: If FPL API request fails
         """
-        # Try cache first
-        cached_data = await self.cache.get(self.CACHE_KEY_ALL_PLAYERS)
+        # Try in-process cache first, reading the clock once for both TTLs
+        if self._players_l1:
+            age = time.monotonic() - self._players_l1[0]
+            if age < self.LOCAL_CACHE_TTL:
+                return self._players_l1[1]
+
+            # Stale but usable: serve it and refresh in the background
+            if age < self.LOCAL_CACHE_HARD_TTL:
+                if self._refresh_task is None or self._refresh_task.done():
+                    self._refresh_task = asyncio.create_task(self._refresh_in_background())
+                return self._players_l1[1]
+
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if self._local_players_fresh():
+                return self._players_l1[1]
+            return await self._load_players()
+
+    async def get_all_players_json(self) -> Tuple[int, bytes]:
+        """Get all players encoded as a JSON array.
+
+        The snapshot is encoded once and the bytes are reused until it is
+        replaced by a refresh.
+
+        Returns:
+            Number of players and the JSON-encoded list
+        """
+        players = await self.get_all_players()
+        if self._players_json is None or self._players_json[0] is not players:
+            self._players_json = (players, _PLAYERS_ADAPTER.dump_json(list(players)))
+        return len(players), self._players_json[1]
+
+    def _local_players_fresh(self) -> bool:
+        """Check whether the in-process player snapshot is within the soft TTL.
+
+        Returns:
+            True if the snapshot is younger than LOCAL_CACHE_TTL
+        """
+        return bool(
+            self._players_l1 and time.monotonic() - self._players_l1[0] < self.LOCAL_CACHE_TTL
+        )
+
+    async def _refresh_in_background(self) -> None:
+        """Refresh the player snapshot without blocking readers of the stale one."""
+        try:
+            async with self._refresh_lock:
+                if not self._local_players_fresh():
+                    await self._load_players()
+        except Exception as e:
+            logger.warning("Background player refresh failed: %s", e)
+
+    async def _load_players(self) -> Tuple[Player, ...]:
+        """Load players from Redis or, failing that, the FPL API.
+
+        Returns:
+            Tuple of all players
+        """
+        cached_data = await self.cache.get_bytes(self.CACHE_KEY_ALL_PLAYERS)
         if cached_data:
             logger.info("Retrieved all players from cache")
-            return [Player(**player) for player in cached_data]
+            # Parse and validate the raw bytes in one pydantic-core pass
+            players = _PLAYERS_ADAPTER.validate_json(cached_data)
+            return self._store_local(players)
 
         # Fetch from API
         logger.info("Fetching all players from FPL API")
         bootstrap_data = await self.fpl_client.get_bootstrap_static()
 
-        # Extract players and teams for name mapping
         players_data = bootstrap_data.get("elements", [])
-        teams_data = bootstrap_data.get("teams", [])
-        element_types = bootstrap_data.get("element_types", [])
+        teams_lookup, position_lookup = self._get_lookups(bootstrap_data)
 
-        # Create lookup dictionaries
-        teams_lookup = {team["id"]: team["name"] for team in teams_data}
-        position_lookup = {pos["id"]: pos["singular_name"] for pos in element_types}
-
-        # Enrich player data with team and position names
-        enriched_players = []
+        # Enrich player data in place, then validate every row in one batched call
         for player_data in players_data:
             player_data["team_name"] = teams_lookup.get(player_data["team"])
             player_data["position"] = position_lookup.get(player_data["element_type"])
-            enriched_players.append(player_data)
-
-        # Convert to Player models
-        players = [Player(**player) for player in enriched_players]
+            for field in self.NUMERIC_FIELDS:
+                value = player_data.get(field)
+                player_data[field] = float(value) if value not in (None, "") else 0.0
+        players = _PLAYERS_ADAPTER.validate_python(players_data)
 
         # Cache the results
-        await self.cache.set(
+        await self.cache.set_bytes(
             self.CACHE_KEY_ALL_PLAYERS,
-            [player.model_dump() for player in players],
+            _PLAYERS_ADAPTER.dump_json(players),
             ttl=300,  # Cache for 5 minutes
         )
 
-        logger.info(f"Retrieved {len(players)} players from FPL API")
-        return players
+        logger.info("Retrieved %s players from FPL API", len(players))
+        return self._store_local(players)
 
-    async def get_player_by_id(self, player_id: int) -> Optional[Player]:
-        """Get a specific player by ID.
+    def _store_local(self, players: Sequence[Player]) -> Tuple[Player, ...]:
+        """Store players in the in-process cache and rebuild the ID index.
 
         Args:
-            player_id: Player ID
+            players: Freshly loaded players
 
         Returns:
-            Player if found, None otherwise
+            Immutable snapshot of the players
         """
-        cache_key = self.CACHE_KEY_PLAYER.format(player_id=player_id)
+        snapshot = tuple(players)
+        self._players_by_id = {player.id: player for player in snapshot}
+        self._players_l1 = (time.monotonic(), snapshot)
+        return snapshot
 
-        # Try cache first
-        cached_data = await self.cache.get(cache_key)
-        if cached_data:
-            logger.info(f"Retrieved player {player_id} from cache")
-            return Player(**cached_data)
+    def _get_lookups(self, bootstrap_data: Dict) -> Tuple[Dict[int, str], Dict[int, str]]:
+        """Get team and position name lookups, reusing them within a gameweek.
+
+        Args:
+            bootstrap_data: FPL bootstrap-static payload
+
+        Returns:
+            Tuple of (team ID -> name, element type -> position name)
+        """
+        current_event = next(
+            (event["id"] for event in bootstrap_data.get("events", []) if event.get("is_current")),
+            None,
+        )
+
+        if current_event is None or current_event != self._lookups_event or not self._teams_lookup:
+            self._teams_lookup = {
+                team["id"]: team["name"] for team in bootstrap_data.get("teams", [])
+            }
+            self._position_lookup = {
+                pos["id"]: pos["singular_name"] for pos in bootstrap_data.get("element_types", [])
+            }
+            self._lookups_event = current_event
+
+        return self._teams_lookup, self._position_lookup
 
-        # Get all players and filter
-        all_players = await self.get_all_players()
-        player = next((p for p in all_players if p.id == player_id), None)
+    async def get_player_by_id(self, player_id: int) -> Optional[Player]:
+        """Get a specific player by ID.
 
-        if player:
-            # Cache individual player
-            await self.cache.set(cache_key, player.model_dump(), ttl=300)
-            logger.info(f"Retrieved player {player_id} from API")
+        Args:
+            player_id: Player ID
 
-        return player
+        Returns:
+            Player if found, None otherwise
+        """
+        # Make sure the snapshot (and its ID index) is loaded and fresh
+        await self.get_all_players()
+        return self._players_by_id.get(player_id)
@@ -1,7 +1,10 @@
 """Team repository for accessing FPL team data."""
 
+import asyncio
 import logging
-from typing import Optional, Dict, TYPE_CHECKING
+from typing import Optional, Dict, Tuple, TYPE_CHECKING
+
+from pydantic import TypeAdapter
 
 from app.infrastructure.http.fpl_client import FPLClient
 from app.infrastructure.cache.redis_cache import RedisCache
@@ -14,6 +17,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_PICKS_ADAPTER = TypeAdapter(list[TeamPick])
+# Parses the cached lookup straight from JSON, restoring int player IDs
+_PLAYERS_LOOKUP_ADAPTER = TypeAdapter(dict[int, dict])
+
 
 class TeamRepository:
     """Repository for FPL team data."""
@@ -22,6 +29,9 @@ class TeamRepository:
     CACHE_KEY_TEAM_PICKS = "fpl:team:{team_id}:event:{event}"
     CACHE_KEY_PLAYERS_LOOKUP = "fpl:players:lookup"
 
+    # Chips that reset free transfers to 1 for the following gameweek
+    FT_RESET_CHIPS = frozenset({"wildcard", "freehit"})
+
     def __init__(
         self,
         fpl_client: FPLClient,
@@ -38,6 +48,11 @@ class TeamRepository:
         self.fpl_client = fpl_client
         self.cache = cache
         self.expected_points_service = expected_points_service
+        # Serializes players lookup rebuilds so concurrent misses share one fetch
+        self._players_lookup_lock = asyncio.Lock()
+        # Last cached lookup payload and its parsed form; the payload only
+        # changes when the lookup is rebuilt
+        self._players_lookup_parsed: Optional[Tuple[bytes, Dict[int, dict]]] = None
 
     async def get_team_by_id(self, team_id: int, include_picks: bool = True) -> Team:
         """Get FPL team by ID.
@@ -56,17 +71,19 @@ class TeamRepository:
         cache_key = self.CACHE_KEY_TEAM.format(team_id=team_id)
 
         # Try cache first (without picks for now)
-        cached_data = await self.cache.get(cache_key)
-        if cached_data and not include_picks:
-            logger.info(f"Retrieved team {team_id} from cache")
-            return Team(**cached_data)
+        if not include_picks:
+            cached_data = await self.cache.get(cache_key)
+            if cached_data:
+                logger.info("Retrieved team %s from cache", team_id)
+                # Cache entries were validated before being stored, so skip re-validation
+                return Team.model_construct(**cached_data)
 
         # Fetch from API
-        logger.info(f"Fetching team {team_id} from FPL API")
+        logger.info("Fetching team %s from FPL API", team_id)
         try:
             team_data = await self.fpl_client.get_entry(team_id)
         except Exception as e:
-            logger.error(f"Failed to fetch team {team_id}: {e}")
+            logger.error("Failed to fetch team %s: %s", team_id, e)
             raise NotFoundException(f"Team with ID {team_id} not found") from e
 
         # Get current event for picks
@@ -75,24 +92,36 @@ class TeamRepository:
         # Create team model (without picks initially)
         team = Team(**team_data)
 
-        # Cache team data
-        await self.cache.set(cache_key, team.model_dump(exclude={"picks"}), ttl=300)
+        # Cache team data, encoded straight to JSON by pydantic-core
+        await self.cache.set_bytes(
+            cache_key, team.model_dump_json(exclude={"picks"}).encode(), ttl=300
+        )
 
         # Get picks if requested and current event exists
         if include_picks and current_event:
-            picks, picks_metadata = await self._get_team_picks(team_id, current_event)
-            # Get purchase prices from transfer history
-            purchase_prices = await self._get_purchase_prices(team_id)
+            # These lookups are independent, so fetch them concurrently
+            (
+                (picks, picks_metadata),
+                purchase_prices,
+                players_lookup,
+                expected_points_map,
+                free_transfers,
+            ) = await asyncio.gather(
+                self._get_team_picks(team_id, current_event),
+                self._get_purchase_prices(team_id),
+                self._get_players_lookup(),
+                self.expected_points_service.calculate_expected_points_for_all_players(),
+                self._calculate_free_transfers(team_id, current_event),
+            )
+
             # Enrich picks with player data and purchase prices
-            picks = await self._enrich_picks_with_player_data(picks, purchase_prices)
-            team.picks = picks
+            team.picks = self._enrich_picks_with_player_data(
+                picks, players_lookup, expected_points_map, purchase_prices
+            )
 
             # Extract transfer information from picks metadata
             entry_history = picks_metadata.get("entry_history", {})
             if entry_history:
-                # Calculate free transfers available
-                free_transfers = await self._calculate_free_transfers(team_id, current_event)
-
                 # Update the transfers dict with transfer stats
                 team.transfers = {
                     "made": entry_history.get("event_transfers", 0),  # Transfers made this gameweek
@@ -102,7 +131,7 @@ class TeamRepository:
                     "free_transfers": free_transfers,  # Available free transfers for next gameweek
                 }
 
-        logger.info(f"Retrieved team {team_id} from FPL API")
+        logger.info("Retrieved team %s from FPL API", team_id)
         return team
 
     async def _get_team_picks(self, team_id: int, event: int) -> tuple[list[TeamPick], dict]:
@@ -119,28 +148,33 @@ class TeamRepository:
 
         # Try cache first
         cached_data = await self.cache.get(cache_key)
-        if cached_data:
-            logger.info(f"Retrieved team {team_id} picks for event {event} from cache")
-            # When returning from cache, we only have picks, not full metadata
-            return [TeamPick(**pick) for pick in cached_data], {}
+        if isinstance(cached_data, dict):
+            logger.info("Retrieved team %s picks for event %s from cache", team_id, event)
+            # Only entry_history is kept from the metadata; it is all callers use
+            # Cache entries were validated before being stored, so skip re-validation
+            picks = [TeamPick.model_construct(**pick) for pick in cached_data["picks"]]
+            return picks, {"entry_history": cached_data.get("entry_history", {})}
 
         # Fetch from API
-        logger.info(f"Fetching team {team_id} picks for event {event} from FPL API")
+        logger.info("Fetching team %s picks for event %s from FPL API", team_id, event)
         picks_data = await self.fpl_client.get_entry_picks(team_id, event)
 
         picks_list = picks_data.get("picks", [])
 
         # Convert to TeamPick models
-        picks = [TeamPick(**pick) for pick in picks_list]
+        picks = _PICKS_ADAPTER.validate_python(picks_list)
 
-        # Cache picks
+        # Cache picks together with the gameweek's entry history
         await self.cache.set(
             cache_key,
-            [pick.model_dump() for pick in picks],
+            {
+                "picks": _PICKS_ADAPTER.dump_python(picks),
+                "entry_history": picks_data.get("entry_history", {}),
+            },
             ttl=600,  # Cache for 10 minutes
         )
 
-        logger.info(f"Retrieved {len(picks)} picks for team {team_id} event {event}")
+        logger.info("Retrieved %s picks for team %s event %s", len(picks), team_id, event)
         return picks, picks_data
 
     async def _get_players_lookup(self) -> Dict[int, dict]:
@@ -150,11 +184,42 @@ class TeamRepository:
             Dictionary mapping player IDs to player data
         """
         # Try cache first
-        cached_data = await self.cache.get(self.CACHE_KEY_PLAYERS_LOOKUP)
+        cached_data = await self.cache.get_bytes(self.CACHE_KEY_PLAYERS_LOOKUP)
         if cached_data:
             logger.info("Retrieved players lookup from cache")
-            return cached_data
+            return self._parse_players_lookup(cached_data)
+
+        async with self._players_lookup_lock:
+            # Another caller may have rebuilt it while we waited for the lock
+            cached_data = await self.cache.get_bytes(self.CACHE_KEY_PLAYERS_LOOKUP)
+            if cached_data:
+                logger.info("Retrieved players lookup from cache")
+                return self._parse_players_lookup(cached_data)
+
+            return await self._build_players_lookup()
+
+    def _parse_players_lookup(self, cached_data: bytes) -> Dict[int, dict]:
+        """Parse a cached players lookup, reusing the last parse if unchanged.
+
+        Args:
+            cached_data: Lookup JSON as stored in Redis
+
+        Returns:
+            Dictionary mapping player IDs to player data (shared, read-only)
+        """
+        if self._players_lookup_parsed and self._players_lookup_parsed[0] == cached_data:
+            return self._players_lookup_parsed[1]
+
+        players_lookup = _PLAYERS_LOOKUP_ADAPTER.validate_json(cached_data)
+        self._players_lookup_parsed = (cached_data, players_lookup)
+        return players_lookup
 
+    async def _build_players_lookup(self) -> Dict[int, dict]:
+        """Build the player lookup dictionary from bootstrap-static and cache it.
+
+        Returns:
+            Dictionary mapping player IDs to player data
+        """
         # Fetch from API
         logger.info("Fetching players lookup from FPL API")
         bootstrap_data = await self.fpl_client.get_bootstrap_static()
@@ -173,22 +238,24 @@ class TeamRepository:
             for team in teams_data
         }
 
-        # Create lookup dictionary with team info
-        players_lookup = {
-            player["id"]: {
+        # Create lookup dictionary with team info (one team lookup per player)
+        empty_team = {"name": "", "short_name": "", "code": 0}
+        players_lookup = {}
+        for player in players_data:
+            team_id = player.get("team", 0)
+            team_info = teams_lookup.get(team_id, empty_team)
+            players_lookup[player["id"]] = {
                 "web_name": player.get("web_name", ""),
                 "first_name": player.get("first_name", ""),
                 "second_name": player.get("second_name", ""),
-                "team": player.get("team", 0),
-                "team_name": teams_lookup.get(player.get("team", 0), {}).get("name", ""),
-                "team_short_name": teams_lookup.get(player.get("team", 0), {}).get("short_name", ""),
-                "team_code": teams_lookup.get(player.get("team", 0), {}).get("code", 0),
+                "team": team_id,
+                "team_name": team_info["name"],
+                "team_short_name": team_info["short_name"],
+                "team_code": team_info["code"],
                 "element_type": player.get("element_type", 0),
                 "now_cost": player.get("now_cost", 0),
                 "ep_next": player.get("ep_next"),  # Expected points next gameweek
             }
-            for player in players_data
-        }
 
         # Cache the lookup
         await self.cache.set(
@@ -197,7 +264,7 @@ class TeamRepository:
             ttl=600,  # Cache for 10 minutes
         )
 
-        logger.info(f"Created lookup for {len(players_lookup)} players")
+        logger.info("Created lookup for %s players", len(players_lookup))
         return players_lookup
 
     async def _get_purchase_prices(self, team_id: int) -> Dict[int, int]:
@@ -219,32 +286,35 @@ class TeamRepository:
             # Process transfers chronologically (oldest first)
             # Transfers are returned newest first, so reverse them
             for transfer in reversed(transfers_data):
+                # Remove player that was transferred out (in and out always differ)
+                purchase_prices.pop(transfer.get("element_out"), None)
+
                 player_in = transfer.get("element_in")
                 purchase_price = transfer.get("element_in_cost")
-
                 if player_in and purchase_price:
                     # Update purchase price (will be overwritten if player was transferred out and back in)
                     purchase_prices[player_in] = purchase_price
 
-                # Remove player that was transferred out
-                player_out = transfer.get("element_out")
-                if player_out and player_out in purchase_prices:
-                    del purchase_prices[player_out]
-
-            logger.info(f"Calculated purchase prices for {len(purchase_prices)} players")
+            logger.info("Calculated purchase prices for %s players", len(purchase_prices))
             return purchase_prices
 
         except Exception as e:
-            logger.error(f"Failed to fetch transfers for team {team_id}: {e}")
+            logger.error("Failed to fetch transfers for team %s: %s", team_id, e)
             return {}
 
-    async def _enrich_picks_with_player_data(
-        self, picks: list[TeamPick], purchase_prices: Dict[int, int] = None
+    def _enrich_picks_with_player_data(
+        self,
+        picks: list[TeamPick],
+        players_lookup: Dict[int, dict],
+        expected_points_map: Dict[int, float],
+        purchase_prices: Optional[Dict[int, int]] = None,
     ) -> list[TeamPick]:
         """Enrich team picks with player data and purchase prices.
 
         Args:
             picks: List of team picks
+            players_lookup: Dictionary mapping player IDs to player data
+            expected_points_map: Dictionary mapping player IDs to expected points
             purchase_prices: Dictionary mapping player IDs to purchase prices
 
         Returns:
@@ -256,39 +326,30 @@ class TeamRepository:
         if purchase_prices is None:
             purchase_prices = {}
 
-        # Get player lookup
-        players_lookup = await self._get_players_lookup()
-
-        # Get calculated expected points for all players
-        expected_points_map = await self.expected_points_service.calculate_expected_points_for_all_players()
-
-        # Enrich each pick
+        # Enrich each pick (model_copy skips re-validating the existing fields)
+        empty_player: dict = {}
         enriched_picks = []
         for pick in picks:
-            player_data = players_lookup.get(pick.element, {})
-
-            # Get calculated expected points (fallback to None if not available)
-            expected_points = expected_points_map.get(pick.element)
-
-            enriched_pick = TeamPick(
-                element=pick.element,
-                position=pick.position,
-                multiplier=pick.multiplier,
-                is_captain=pick.is_captain,
-                is_vice_captain=pick.is_vice_captain,
-                player_name=player_data.get("web_name"),
-                player_first_name=player_data.get("first_name"),
-                player_second_name=player_data.get("second_name"),
-                player_team=player_data.get("team"),
-                player_team_name=player_data.get("team_name"),
-                player_team_short_name=player_data.get("team_short_name"),
-                player_team_code=player_data.get("team_code"),
-                player_position=player_data.get("element_type"),
-                player_cost=player_data.get("now_cost"),
-                purchase_price=purchase_prices.get(pick.element),
-                expected_points=expected_points,
+            player_data = players_lookup.get(pick.element, empty_player)
+
+            enriched_picks.append(
+                pick.model_copy(
+                    update={
+                        "player_name": player_data.get("web_name"),
+                        "player_first_name": player_data.get("first_name"),
+                        "player_second_name": player_data.get("second_name"),
+                        "player_team": player_data.get("team"),
+                        "player_team_name": player_data.get("team_name"),
+                        "player_team_short_name": player_data.get("team_short_name"),
+                        "player_team_code": player_data.get("team_code"),
+                        "player_position": player_data.get("element_type"),
+                        "player_cost": player_data.get("now_cost"),
+                        "purchase_price": purchase_prices.get(pick.element),
+                        # Calculated expected points (None if not available)
+                        "expected_points": expected_points_map.get(pick.element),
+                    }
+                )
             )
-            enriched_picks.append(enriched_pick)
 
         return enriched_picks
 
@@ -304,8 +365,7 @@ class TeamRepository:
         """
         try:
             # Fetch gameweek-by-gameweek history
-            logger.info(f"=== FREE TRANSFER CALCULATION FOR TEAM {team_id} ===")
-            logger.info(f"Current (last completed) gameweek: {current_event}")
+            logger.info("Calculating free transfers for team %s after GW%s", team_id, current_event)
 
             history_data = await self.fpl_client.get_entry_history(team_id)
             current_history = history_data.get("current", [])
@@ -314,21 +374,7 @@ class TeamRepository:
                 logger.info("No history data available - defaulting to 1 FT")
                 return 1  # Default to 1 FT
 
-            logger.info(f"Total gameweeks in history: {len(current_history)}")
-            logger.info(f"Raw history data sample (first GW): {current_history[0] if current_history else 'None'}")
-
-            # Print all gameweek data for debugging
-            for gw_data in current_history:
-                event = gw_data.get("event")
-                active_chip = gw_data.get("active_chip")
-                event_transfers = gw_data.get("event_transfers", 0)
-                event_transfers_cost = gw_data.get("event_transfers_cost", 0)
-                logger.info(
-                    f"GW{event}: transfers={event_transfers}, cost={event_transfers_cost}, "
-                    f"chip={active_chip if active_chip else 'None'}"
-                )
-
-            logger.info(f"\n--- Analyzing transfers to calculate FT for GW{current_event + 1} ---")
+            debug = logger.isEnabledFor(logging.DEBUG)
 
             # Track FT week by week going FORWARD from GW1
             # You get 1 FT for GW2 (after GW1 completes)
@@ -347,14 +393,17 @@ class TeamRepository:
                 event_transfers = gw_data.get("event_transfers", 0)
                 event_transfers_cost = gw_data.get("event_transfers_cost", 0)
 
-                logger.info(f"GW{event}: Started with {available_ft} FT")
+                if debug:
+                    logger.debug(
+                        "GW%s: started with %s FT, transfers=%s, "
+                        "cost=%s, chip=%s",
+                        event, available_ft, event_transfers, event_transfers_cost, active_chip
+                    )
 
                 # Check for wildcards and free hits (they reset free transfers)
-                if active_chip in ["wildcard", "freehit"]:
-                    logger.info(f"  ➜ {active_chip.upper()} used - unlimited transfers")
+                if active_chip in self.FT_RESET_CHIPS:
                     # After wildcard/freehit, you get 1 FT for next GW
                     available_ft = 1
-                    logger.info(f"  ➜ Next GW will have {available_ft} FT")
                     last_wildcard_gw = event
                     continue
 
@@ -363,27 +412,19 @@ class TeamRepository:
                     # Calculate how many paid transfers (4 points per transfer)
                     paid_transfers = event_transfers_cost // 4
                     free_used = event_transfers - paid_transfers
-                    logger.info(f"  ➜ Made {event_transfers} transfers ({free_used} free, {paid_transfers} paid, cost={event_transfers_cost})")
                     # Subtract free transfers used, then add 1 for next week
                     available_ft = max(0, available_ft - free_used) + 1
-                    logger.info(f"  ➜ Next GW will have {available_ft} FT")
                 elif event_transfers > 0:
                     # Used free transfers without taking a hit
-                    logger.info(f"  ➜ Made {event_transfers} free transfers")
                     # Subtract transfers used, then add 1 for next week (min 1)
                     available_ft = max(1, available_ft - event_transfers + 1)
-                    logger.info(f"  ➜ Next GW will have {available_ft} FT")
                 else:
                     # No transfers made - add 1 FT for next week (max 5)
                     available_ft = min(available_ft + 1, 5)
-                    logger.info(f"  ➜ No transfers - banking FT")
-                    logger.info(f"  ➜ Next GW will have {available_ft} FT")
 
-            logger.info(f"\n=== FINAL CALCULATION ===")
-            logger.info(f"After GW{current_event}: {available_ft} FT available for GW{current_event + 1}")
-            logger.info(f"=====================================\n")
+            logger.info("Team %s: %s FT available for GW%s", team_id, available_ft, current_event + 1)
             return available_ft
 
         except Exception as e:
-            logger.error(f"Failed to calculate free transfers for team {team_id}: {e}")
+            logger.error("Failed to calculate free transfers for team %s: %s", team_id, e)
             return 1  # Default to 1 FT on error
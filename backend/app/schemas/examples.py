@@ -0,0 +1,76 @@
+"""OpenAPI example payloads.
+
+Kept out of the domain models so hot-path classes stay lean; referenced
+from route decorators only.
+"""
+
+from typing import Any, Dict
+
+PLAYER_EXAMPLE: Dict[str, Any] = {
+    "id": 1,
+    "web_name": "Salah",
+    "first_name": "Mohamed",
+    "second_name": "Salah",
+    "team": 10,
+    "team_name": "Liverpool",
+    "element_type": 3,
+    "position": "Midfielder",
+    "now_cost": 130,
+    "total_points": 245,
+    "form": 7.5,
+    "selected_by_percent": 45.2,
+    "status": "a",
+}
+
+TEAM_PICK_EXAMPLE: Dict[str, Any] = {
+    "element": 1,
+    "position": 1,
+    "multiplier": 2,
+    "is_captain": True,
+    "is_vice_captain": False,
+    "player_name": "Salah",
+    "player_first_name": "Mohamed",
+    "player_second_name": "Salah",
+    "player_team": 10,
+    "player_position": 3,
+    "player_cost": 130,
+}
+
+PLAYER_RESPONSE_EXAMPLE: Dict[str, Any] = {
+    "success": True,
+    "message": "Player 1 retrieved successfully",
+    "data": PLAYER_EXAMPLE,
+}
+
+TEAM_RESPONSE_EXAMPLE: Dict[str, Any] = {
+    "success": True,
+    "message": "Team 123456 retrieved successfully",
+    "data": {
+        "id": 123456,
+        "name": "My FPL Team",
+        "player_first_name": "John",
+        "player_last_name": "Doe",
+        "started_event": 1,
+        "summary_overall_points": 1234,
+        "summary_overall_rank": 500000,
+        "summary_event_points": 65,
+        "summary_event_rank": 1000000,
+        "current_event": 8,
+        "total_transfers": 7,
+        "bank": 15,
+        "team_value": 1015,
+        "picks": [TEAM_PICK_EXAMPLE],
+    },
+}
+
+
+def example_response(example: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    """Build a route ``responses`` entry documenting a 200 example.
+
+    Args:
+        example: Example response body
+
+    Returns:
+        Mapping suitable for the ``responses`` argument of a route decorator
+    """
+    return {200: {"content": {"application/json": {"example": example}}}}
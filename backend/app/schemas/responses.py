@@ -1,25 +1,24 @@
 """API response schemas."""
 
-from typing import Generic, TypeVar, Optional, List, Dict
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
 
 from app.models.player import Player
+from app.models.player_with_fixtures import PlayerWithFixtures
 from app.models.team import Team
 
-T = TypeVar("T")
 
+class BaseResponse(BaseModel):
+    """Base response envelope.
 
-class BaseResponse(BaseModel, Generic[T]):
-    """Base response schema with generic data type."""
+    Subclasses declare a concrete ``data`` field rather than parametrizing a
+    generic, so each envelope's schema is built once at class definition.
+    """
 
     success: bool = Field(..., description="Whether request was successful")
     message: Optional[str] = Field(None, description="Response message")
-    data: Optional[T] = Field(None, description="Response data")
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ErrorDetail(BaseModel):
@@ -29,6 +28,9 @@ class ErrorDetail(BaseModel):
     message: str = Field(..., description="Error message")
     type: Optional[str] = Field(None, description="Error type")
 
+    # Only built on error paths, so skip schema construction at import
+    model_config = ConfigDict(defer_build=True)
+
 
 class ErrorResponse(BaseModel):
     """Error response schema."""
@@ -37,16 +39,16 @@ class ErrorResponse(BaseModel):
     message: str = Field(..., description="Error message")
     errors: Optional[List[ErrorDetail]] = Field(None, description="Detailed errors")
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "success": False,
                 "message": "Validation error",
                 "errors": [{"field": "team_id", "message": "Team not found", "type": "not_found"}],
             }
-        }
+        },
+    )
 
 
 class HealthResponse(BaseModel):
@@ -56,21 +58,20 @@ class HealthResponse(BaseModel):
     version: str = Field(..., description="API version")
     environment: str = Field(..., description="Environment")
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {"status": "healthy", "version": "1.0.0", "environment": "production"}
         }
+    )
 
 
-class PlayersResponse(BaseResponse[List[Player]]):
+class PlayersResponse(BaseResponse):
     """Response schema for players list."""
 
-    class Config:
-        """Pydantic config."""
+    data: Optional[List[Player]] = Field(None, description="Response data")
 
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "Players retrieved successfully",
@@ -90,15 +91,28 @@ class PlayersResponse(BaseResponse[List[Player]]):
                 ],
             }
         }
+    )
+
+
+class PlayerResponse(BaseResponse):
+    """Response schema for a single player."""
 
+    data: Optional[Player] = Field(None, description="Response data")
 
-class TeamResponse(BaseResponse[Team]):
+
+class PlayersWithFixturesResponse(BaseResponse):
+    """Response schema for players with upcoming expected points."""
+
+    data: Optional[List[PlayerWithFixtures]] = Field(None, description="Response data")
+
+
+class TeamResponse(BaseResponse):
     """Response schema for team data."""
 
-    class Config:
-        """Pydantic config."""
+    data: Optional[Team] = Field(None, description="Response data")
 
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "Team retrieved successfully",
@@ -112,6 +126,14 @@ class TeamResponse(BaseResponse[Team]):
                 },
             }
         }
+    )
+
+
+class TeamSummaryResponse(BaseResponse):
+    """Response schema for team summary statistics."""
+
+    # Built by the service from trusted data; pass it through unvalidated
+    data: Optional[SkipValidation[dict]] = Field(None, description="Response data")
 
 
 class TransferRecommendation(BaseModel):
@@ -146,13 +168,13 @@ class TransferPlanData(BaseModel):
     improvement: float = Field(..., description="Total improvement in points from transfers")
 
 
-class TransferPlanResponse(BaseResponse[TransferPlanData]):
+class TransferPlanResponse(BaseResponse):
     """Response schema for transfer plan."""
 
-    class Config:
-        """Pydantic config."""
+    data: Optional[TransferPlanData] = Field(None, description="Response data")
 
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "Transfer plan generated successfully",
@@ -175,3 +197,4 @@ class TransferPlanResponse(BaseResponse[TransferPlanData]):
                 },
             }
         }
+    )
@@ -1,14 +1,22 @@
 """Expected points calculation service for FPL players."""
 
+import asyncio
 import logging
-from typing import Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+from pydantic import TypeAdapter
+
 from app.infrastructure.http.fpl_client import FPLClient
 from app.infrastructure.cache.redis_cache import RedisCache
 
 logger = logging.getLogger(__name__)
 
+# Parses the cached map straight from JSON, restoring int element IDs
+_EXPECTED_POINTS_ADAPTER = TypeAdapter(Dict[int, float])
+
 
 class ExpectedPointsService:
     """Service for calculating custom expected points for FPL players."""
@@ -17,6 +25,9 @@ class ExpectedPointsService:
     CACHE_KEY_EXPECTED_POINTS = "fpl:expected_points:{element_id}"
     CACHE_KEY_ALL_EXPECTED_POINTS = "fpl:expected_points:all"
 
+    # Expected points only change with new FPL data; matches the Redis TTL
+    ALL_EXPECTED_POINTS_TTL = 600
+
     # Weighting factors for expected points calculation
     WEIGHT_FORM = 0.25  # Recent form (last 3-5 gameweeks)
     WEIGHT_FIXTURE_DIFFICULTY = 0.20  # Opponent strength
@@ -25,6 +36,11 @@ class ExpectedPointsService:
     WEIGHT_UNDERLYING_STATS = 0.20  # xG, xA, xGI, xGC
     WEIGHT_TEAM_FORM = 0.10  # Team performance
 
+    # FPL element types
+    ELEMENT_TYPE_GK = 1
+    ELEMENT_TYPE_DEF = 2
+    ATTACKING_ELEMENT_TYPES = frozenset({3, 4})  # MID, FWD
+
     def __init__(self, fpl_client: FPLClient, cache: RedisCache):
         """Initialize expected points service.
 
@@ -34,6 +50,11 @@ class ExpectedPointsService:
         """
         self.fpl_client = fpl_client
         self.cache = cache
+        self._all_expected_points: Optional[Tuple[float, Dict[int, float]]] = None
+        # Serializes all-players recomputes so concurrent callers share one
+        self._all_expected_points_lock = asyncio.Lock()
+        # N-gameweek computations in flight, shared by concurrent callers
+        self._next_n_in_flight: Dict[int, asyncio.Task] = {}
 
     async def calculate_expected_points_for_all_players(self) -> Dict[int, float]:
         """Calculate expected points for all players.
@@ -41,57 +62,71 @@ class ExpectedPointsService:
         Returns:
             Dictionary mapping player element IDs to expected points
         """
-        # Check cache first
-        cached_data = await self.cache.get(self.CACHE_KEY_ALL_EXPECTED_POINTS)
+        # Check in-process memo, then Redis
+        if self._local_expected_points_fresh():
+            return self._all_expected_points[1]
+
+        async with self._all_expected_points_lock:
+            # Another caller may have recomputed while we waited for the lock
+            if self._local_expected_points_fresh():
+                return self._all_expected_points[1]
+            return await self._load_expected_points_for_all_players()
+
+    def _local_expected_points_fresh(self) -> bool:
+        """Check whether the in-process expected points memo is within its TTL.
+
+        Returns:
+            True if the memo is younger than ALL_EXPECTED_POINTS_TTL
+        """
+        return bool(
+            self._all_expected_points
+            and time.monotonic() - self._all_expected_points[0] < self.ALL_EXPECTED_POINTS_TTL
+        )
+
+    async def _load_expected_points_for_all_players(self) -> Dict[int, float]:
+        """Load expected points from Redis or compute them from FPL data.
+
+        Returns:
+            Dictionary mapping player element IDs to expected points
+        """
+        cached_data = await self.cache.get_bytes(self.CACHE_KEY_ALL_EXPECTED_POINTS)
         if cached_data:
             logger.info("Retrieved all expected points from cache")
-            return cached_data
+            expected_points_map = _EXPECTED_POINTS_ADAPTER.validate_json(cached_data)
+            self._all_expected_points = (time.monotonic(), expected_points_map)
+            return expected_points_map
 
         logger.info("Calculating expected points for all players")
 
-        # Get bootstrap data with all players
-        bootstrap_data = await self.fpl_client.get_bootstrap_static()
+        # Get bootstrap data with all players and fixtures for difficulty ratings
+        bootstrap_data, fixtures_data = await asyncio.gather(
+            self.fpl_client.get_bootstrap_static(), self._get_fixtures()
+        )
         players_data = bootstrap_data.get("elements", [])
-        teams_data = bootstrap_data.get("teams", [])
         events_data = bootstrap_data.get("events", [])
 
-        # Get fixtures for difficulty ratings
-        fixtures_data = await self._get_fixtures()
-
         # Find next gameweek
         next_event = self._get_next_event(events_data)
         if not next_event:
             logger.warning("No upcoming gameweek found")
             return {}
 
-        # Create team lookup for team strength
-        teams_lookup = {team["id"]: team for team in teams_data}
-
-        # Calculate expected points for each player
-        expected_points_map: Dict[int, float] = {}
-
-        for player in players_data:
-            element_id = player["id"]
-            player_team_id = player.get("team")
-
-            # Get player's next fixture
-            next_fixture = self._get_next_fixture_for_team(
-                fixtures_data, player_team_id, next_event["id"]
-            )
-
-            # Calculate expected points
-            expected_points = await self._calculate_player_expected_points(
-                player, next_fixture, teams_lookup
-            )
-
-            expected_points_map[element_id] = expected_points
+        # Calculate expected points for every player in one vectorized pass
+        player_arrays = self._build_player_arrays(players_data)
+        expected_points = self._calculate_expected_points_batch(
+            player_arrays, self._index_fixtures(fixtures_data), next_event["id"]
+        )
+        expected_points_map: Dict[int, float] = dict(zip(player_arrays["id"], expected_points))
 
         # Cache results for 10 minutes
         await self.cache.set(
-            self.CACHE_KEY_ALL_EXPECTED_POINTS, expected_points_map, ttl=600
+            self.CACHE_KEY_ALL_EXPECTED_POINTS,
+            expected_points_map,
+            ttl=self.ALL_EXPECTED_POINTS_TTL,
         )
+        self._all_expected_points = (time.monotonic(), expected_points_map)
 
-        logger.info(f"Calculated expected points for {len(expected_points_map)} players")
+        logger.info("Calculated expected points for %s players", len(expected_points_map))
         return expected_points_map
 
     async def calculate_expected_points(self, element_id: int) -> Optional[float]:
@@ -108,10 +143,10 @@ class ExpectedPointsService:
         # Check cache first
         cached_data = await self.cache.get(cache_key)
         if cached_data is not None:
-            logger.info(f"Retrieved expected points for player {element_id} from cache")
+            logger.info("Retrieved expected points for player %s from cache", element_id)
             return cached_data
 
-        logger.info(f"Calculating expected points for player {element_id}")
+        logger.info("Calculating expected points for player %s", element_id)
 
         try:
             # Get all expected points (this will be cached)
@@ -126,164 +161,207 @@ class ExpectedPointsService:
             return expected_points
 
         except Exception as e:
-            logger.error(f"Failed to calculate expected points for player {element_id}: {e}")
+            logger.error("Failed to calculate expected points for player %s: %s", element_id, e)
             return None
 
-    async def _calculate_player_expected_points(
-        self,
-        player: Dict,
-        next_fixture: Optional[Dict],
-        teams_lookup: Dict[int, Dict],
-    ) -> float:
-        """Calculate expected points for a player.
+    @staticmethod
+    def _build_player_arrays(players_data: List[Dict]) -> Dict[str, Any]:
+        """Extract the expected points model inputs into per-player arrays.
 
         Args:
-            player: Player data from bootstrap-static
-            next_fixture: Next fixture data (None if no upcoming fixture)
-            teams_lookup: Dictionary of team data
+            players_data: Player rows from bootstrap-static
 
         Returns:
-            Calculated expected points
+            Player IDs (list) and float/int arrays of the model inputs, all in
+            players_data order
         """
-        # Extract player stats
-        form = float(player.get("form", 0) or 0)
-        minutes = int(player.get("minutes", 0))
-        # FPL API uses "starts" not "games_played"
-        games_played = player.get("starts", 0)
-        element_type = int(player.get("element_type", 0))  # 1=GK, 2=DEF, 3=MID, 4=FWD
+        return {
+            "id": [player["id"] for player in players_data],
+            "team": np.fromiter(
+                (player.get("team") or 0 for player in players_data), dtype=np.int64, count=len(players_data)
+            ),
+            "element_type": np.fromiter(
+                (int(player.get("element_type", 0)) for player in players_data),
+                dtype=np.int64,
+                count=len(players_data),
+            ),
+            "form": np.fromiter(
+                (float(player.get("form", 0) or 0) for player in players_data),
+                dtype=np.float64,
+                count=len(players_data),
+            ),
+            "minutes": np.fromiter(
+                (int(player.get("minutes", 0)) for player in players_data),
+                dtype=np.float64,
+                count=len(players_data),
+            ),
+            # FPL API uses "starts" not "games_played"
+            "starts": np.fromiter(
+                (player.get("starts", 0) or 0 for player in players_data),
+                dtype=np.float64,
+                count=len(players_data),
+            ),
+            # Underlying stats (cumulative season totals)
+            "xgi": np.fromiter(
+                (float(player.get("expected_goal_involvements", 0) or 0) for player in players_data),
+                dtype=np.float64,
+                count=len(players_data),
+            ),
+            "xgc": np.fromiter(
+                (float(player.get("expected_goals_conceded", 0) or 0) for player in players_data),
+                dtype=np.float64,
+                count=len(players_data),
+            ),
+        }
+
+    def _fixture_arrays(
+        self, team_ids: np.ndarray, fixture_index: Dict[Tuple[int, int], Dict], event_id: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get each player's fixture context for a gameweek.
+
+        The fixture is looked up once per team and broadcast to its players.
 
-        # If player hasn't played at all, return low expected points
-        if games_played == 0 or minutes == 0:
-            return 1.0
+        Args:
+            team_ids: Team ID per player (0 if unknown)
+            fixture_index: Fixtures by (event ID, team ID)
+            event_id: Gameweek/event ID
 
-        # Ensure games_played is at least 1 for division
-        games_played = max(games_played, 1)
+        Returns:
+            Per-player arrays: has a fixture, plays at home, difficulty (1-5)
+        """
+        size = int(team_ids.max(initial=0)) + 1
+        has_fixture = np.zeros(size, dtype=bool)
+        is_home = np.zeros(size, dtype=bool)
+        difficulty = np.full(size, 3.0)
+
+        for team_id in np.unique(team_ids).tolist():
+            fixture = self._get_next_fixture_for_team(fixture_index, team_id, event_id)
+            if not fixture:
+                continue
+            home = fixture.get("team_h") == team_id
+            has_fixture[team_id] = True
+            is_home[team_id] = home
+            # Get difficulty rating (1-5, where 1 is easiest)
+            difficulty[team_id] = (
+                fixture.get("team_h_difficulty", 3) if home else fixture.get("team_a_difficulty", 3)
+            )
 
-        # Underlying stats (cumulative season totals)
-        xg = float(player.get("expected_goals", 0) or 0)
-        xa = float(player.get("expected_assists", 0) or 0)
-        xgi = float(player.get("expected_goal_involvements", 0) or 0)
-        xgc = float(player.get("expected_goals_conceded", 0) or 0)
+        return has_fixture[team_ids], is_home[team_ids], difficulty[team_ids]
 
-        # Calculate average minutes per game early for use in baseline calculation
-        avg_minutes_per_game = minutes / games_played
+    def _calculate_expected_points_batch(
+        self,
+        players: Dict[str, Any],
+        fixture_index: Dict[Tuple[int, int], Dict],
+        event_id: int,
+    ) -> List[float]:
+        """Calculate expected points for all players for one gameweek.
 
-        # --- Start with form as baseline (average points per game) ---
-        base_score = form
+        Evaluates the model for every player at once with array operations;
+        position-specific rules are applied through masks.
 
-        # If form is 0 but player is a regular starter, use underlying stats as baseline
-        if form == 0 and avg_minutes_per_game > 60:
-            # Use xGI for attackers, or a small baseline for defenders/GKs
-            if element_type in [3, 4]:  # MID, FWD
-                xgi_per_game = xgi / games_played if xgi > 0 else 0
-                base_score = max(1.5, min(xgi_per_game * 5, 3.0))  # Cap at 3.0
-            else:
-                base_score = 2.0  # Defenders and GKs with no form get 2.0
+        Args:
+            players: Arrays from _build_player_arrays
+            fixture_index: Fixtures by (event ID, team ID) from _index_fixtures
+            event_id: Gameweek/event ID
 
-        # --- Fixture Difficulty Multiplier (0.7 to 1.3) ---
-        fixture_multiplier = 1.0
-        home_multiplier = 1.0
+        Returns:
+            Expected points per player, rounded to 0.1, in input order
+        """
+        form = players["form"]
+        minutes = players["minutes"]
+        starts = players["starts"]
+        element_type = players["element_type"]
+        xgi = players["xgi"]
+        xgc = players["xgc"]
 
-        if next_fixture:
-            player_team_id = player.get("team")
-            is_home = next_fixture.get("team_h") == player_team_id
+        # Players who haven't played at all get low expected points
+        played = (starts != 0) & (minutes != 0)
 
-            # Get difficulty rating (1-5, where 1 is easiest)
-            difficulty = (
-                next_fixture.get("team_h_difficulty", 3)
-                if is_home
-                else next_fixture.get("team_a_difficulty", 3)
-            )
+        # Ensure games_played is at least 1 for division
+        games_played = np.maximum(starts, 1)
+        avg_minutes_per_game = minutes / games_played
+        xgi_per_game = xgi / games_played
+        xgc_per_game = xgc / games_played
+
+        attacking = np.isin(element_type, tuple(self.ATTACKING_ELEMENT_TYPES))
+        defender = element_type == self.ELEMENT_TYPE_DEF
+        goalkeeper = element_type == self.ELEMENT_TYPE_GK
 
-            # Convert difficulty to multiplier
-            # Difficulty 1 (easiest): 1.3x
-            # Difficulty 2: 1.15x
-            # Difficulty 3 (average): 1.0x
-            # Difficulty 4: 0.85x
-            # Difficulty 5 (hardest): 0.7x
-            fixture_multiplier = 1.0 + (3 - difficulty) * 0.15
+        # --- Start with form as baseline (average points per game) ---
+        # If form is 0 but player is a regular starter, use underlying stats:
+        # xGI for attackers (1.5 to 3.0), 2.0 for defenders and GKs
+        attacking_baseline = np.maximum(
+            1.5, np.minimum(np.where(xgi > 0, xgi_per_game, 0.0) * 5, 3.0)
+        )
+        base_score = np.where(
+            (form == 0) & (avg_minutes_per_game > 60),
+            np.where(attacking, attacking_baseline, 2.0),
+            form,
+        )
 
-            # Home/away multiplier
-            # Home: 1.1x (10% boost)
-            # Away: 0.95x (5% penalty)
-            home_multiplier = 1.1 if is_home else 0.95
+        # --- Fixture difficulty (0.7x to 1.3x) and home (1.1x) / away (0.95x) ---
+        has_fixture, is_home, difficulty = self._fixture_arrays(
+            players["team"], fixture_index, event_id
+        )
+        fixture_multiplier = np.where(has_fixture, 1.0 + (3 - difficulty) * 0.15, 1.0)
+        home_multiplier = np.where(has_fixture, np.where(is_home, 1.1, 0.95), 1.0)
 
         # --- Minutes likelihood multiplier (0.3 to 1.0) ---
-        # Players who don't play full games get penalized
-        minutes_multiplier = 0.3 + (min(avg_minutes_per_game / 90, 1.0) * 0.7)
+        minutes_multiplier = 0.3 + (np.minimum(avg_minutes_per_game / 90, 1.0) * 0.7)
 
         # --- Underlying stats adjustment (position-specific) ---
-        underlying_adjustment = 0.0
-
-        if element_type in [3, 4]:  # MID, FWD
-            # Compare xGI per game to form
-            # Good attackers should have xGI close to or above their form
-            xgi_per_game = xgi / games_played
-            # If xGI is higher than form, add up to +1 point
-            # If xGI is lower than form, subtract up to -0.5 points
-            xgi_diff = xgi_per_game - (form * 0.5)
-            underlying_adjustment = max(-0.5, min(1.0, xgi_diff))
-
-        elif element_type == 2:  # DEF
-            # Defenders: lower xGC is better (clean sheet potential)
-            xgc_per_game = xgc / games_played
-            # Average xGC is around 1.0-1.2 per game
-            # Below 1.0 is good, add bonus
-            # Above 1.2 is bad, subtract
-            if xgc_per_game < 1.0:
-                underlying_adjustment = (1.0 - xgc_per_game) * 0.5
-            elif xgc_per_game > 1.2:
-                underlying_adjustment = (1.2 - xgc_per_game) * 0.3
-
-            # Also consider attacking threat for defenders
-            xgi_per_game = xgi / games_played
-            if xgi_per_game > 0.1:  # Decent attacking threat
-                underlying_adjustment += xgi_per_game * 0.5
-
-        elif element_type == 1:  # GK
-            # Goalkeepers: focus on clean sheet potential
-            xgc_per_game = xgc / games_played
-            # Lower xGC means better chance of clean sheet
-            if xgc_per_game < 1.0:
-                underlying_adjustment = (1.0 - xgc_per_game) * 0.8
-            elif xgc_per_game > 1.5:
-                underlying_adjustment = (1.5 - xgc_per_game) * 0.4
+        # Attackers: xGI per game against form, from -0.5 to +1.0
+        attacking_adjustment = np.clip(xgi_per_game - (form * 0.5), -0.5, 1.0)
+        # Defenders: bonus below 1.0 xGC per game, penalty above 1.2, plus
+        # attacking threat above 0.1 xGI per game
+        defender_adjustment = np.where(
+            xgc_per_game < 1.0,
+            (1.0 - xgc_per_game) * 0.5,
+            np.where(xgc_per_game > 1.2, (1.2 - xgc_per_game) * 0.3, 0.0),
+        )
+        defender_adjustment = np.where(
+            xgi_per_game > 0.1, defender_adjustment + xgi_per_game * 0.5, defender_adjustment
+        )
+        # Goalkeepers: bonus below 1.0 xGC per game, penalty above 1.5
+        goalkeeper_adjustment = np.where(
+            xgc_per_game < 1.0,
+            (1.0 - xgc_per_game) * 0.8,
+            np.where(xgc_per_game > 1.5, (1.5 - xgc_per_game) * 0.4, 0.0),
+        )
+        underlying_adjustment = np.select(
+            [attacking, defender, goalkeeper],
+            [attacking_adjustment, defender_adjustment, goalkeeper_adjustment],
+            0.0,
+        )
 
         # --- Calculate final expected points ---
-        # Apply multipliers to base form score
-        expected_points = base_score * fixture_multiplier * home_multiplier * minutes_multiplier
-
-        # Cap after multipliers to prevent explosion
-        expected_points = min(expected_points, 8.0)
+        # Apply multipliers to base form score, capped to prevent explosion
+        expected_points = np.minimum(
+            base_score * fixture_multiplier * home_multiplier * minutes_multiplier, 8.0
+        )
 
         # Add underlying stats adjustment (capped contribution)
-        expected_points += max(-1.0, min(underlying_adjustment, 1.5))
+        expected_points = expected_points + np.clip(underlying_adjustment, -1.0, 1.5)
 
         # Ensure reasonable range (0.5 to 8)
-        # Top players in best fixtures might hit 7-8
-        # Average players in average fixtures should be 3-5
-        # Bench fodder or bad fixtures should be 1-3
-        expected_points = max(0.5, min(expected_points, 8.0))
-
-        final_value = round(expected_points, 1)
-
-        # Debug logging for high values
-        if final_value > 8.0:
-            logger.warning(
-                f"Player {player.get('web_name', player.get('id'))} has xP > 8.0: {final_value} "
-                f"(form={form}, base={base_score}, fixture_mult={fixture_multiplier}, "
-                f"home_mult={home_multiplier}, mins_mult={minutes_multiplier})"
-            )
+        expected_points = np.where(played, np.clip(expected_points, 0.5, 8.0), 1.0)
+
+        # Round with Python's round() so values match the scalar model exactly
+        final_values = [round(value, 1) for value in expected_points.tolist()]
 
         # Specific logging for Mateta (ID 283)
-        if player.get('id') == 283:
-            logger.warning(
-                f"MATETA (283) - xP: {final_value} | form: {form}, base: {base_score:.2f}, "
-                f"fixture_mult: {fixture_multiplier:.2f}, home_mult: {home_multiplier:.2f}, "
-                f"mins_mult: {minutes_multiplier:.2f}, underlying_adj: {underlying_adjustment:.2f}"
-            )
+        if 283 in players["id"]:
+            i = players["id"].index(283)
+            if played[i]:
+                logger.warning(
+                    "MATETA (283) - xP: %s | form: %s, base: %.2f, "
+                    "fixture_mult: %.2f, home_mult: %.2f, "
+                    "mins_mult: %.2f, underlying_adj: %.2f",
+                    final_values[i], form[i], base_score[i], fixture_multiplier[i],
+                    home_multiplier[i], minutes_multiplier[i], underlying_adjustment[i],
+                )
 
-        return final_value
+        return final_values
 
     async def _get_fixtures(self) -> List[Dict]:
         """Get all fixtures with caching.
@@ -304,7 +382,7 @@ class ExpectedPointsService:
         # Cache for 30 minutes
         await self.cache.set(self.CACHE_KEY_FIXTURES, fixtures_data, ttl=1800)
 
-        logger.info(f"Retrieved {len(fixtures_data)} fixtures")
+        logger.info("Retrieved %s fixtures", len(fixtures_data))
         return fixtures_data
 
     def _get_next_event(self, events_data: List[Dict]) -> Optional[Dict]:
@@ -327,48 +405,79 @@ class ExpectedPointsService:
 
         return None
 
+    @staticmethod
+    def _index_fixtures(fixtures_data: List[Dict]) -> Dict[Tuple[int, int], Dict]:
+        """Index fixtures by (event ID, team ID) for both teams of each fixture.
+
+        Args:
+            fixtures_data: List of all fixtures
+
+        Returns:
+            Dictionary mapping (event ID, team ID) to that team's fixture
+        """
+        fixture_index: Dict[Tuple[int, int], Dict] = {}
+        for fixture in fixtures_data:
+            event_id = fixture.get("event")
+            # Keep the first fixture listed when a team plays twice in a gameweek
+            fixture_index.setdefault((event_id, fixture.get("team_h")), fixture)
+            fixture_index.setdefault((event_id, fixture.get("team_a")), fixture)
+        return fixture_index
+
     def _get_next_fixture_for_team(
-        self, fixtures_data: List[Dict], team_id: int, event_id: int
+        self, fixture_index: Dict[Tuple[int, int], Dict], team_id: int, event_id: int
     ) -> Optional[Dict]:
         """Get next fixture for a team in a specific gameweek.
 
         Args:
-            fixtures_data: List of all fixtures
+            fixture_index: Fixtures by (event ID, team ID) from _index_fixtures
             team_id: Team ID
             event_id: Gameweek/event ID
 
         Returns:
             Fixture data or None
         """
-        for fixture in fixtures_data:
-            if fixture.get("event") == event_id:
-                if fixture.get("team_h") == team_id or fixture.get("team_a") == team_id:
-                    return fixture
-
-        return None
+        return fixture_index.get((event_id, team_id))
 
     async def calculate_expected_points_next_n_gameweeks(
         self, num_gameweeks: int = 5
     ) -> Dict[int, List[float]]:
         """Calculate expected points for all players for the next N gameweeks.
 
+        Concurrent calls for the same horizon share one computation. The
+        returned map is shared between those callers and must not be mutated.
+
         Args:
             num_gameweeks: Number of upcoming gameweeks to calculate (default 5)
 
         Returns:
             Dictionary mapping player element IDs to list of expected points per gameweek
         """
-        logger.info(f"Calculating expected points for next {num_gameweeks} gameweeks")
+        task = self._next_n_in_flight.get(num_gameweeks)
+        if task is None:
+            task = asyncio.ensure_future(self._calculate_next_n_gameweeks(num_gameweeks))
+            self._next_n_in_flight[num_gameweeks] = task
+            task.add_done_callback(lambda _: self._next_n_in_flight.pop(num_gameweeks, None))
+        # Shield so one cancelled caller does not cancel the others
+        return await asyncio.shield(task)
+
+    async def _calculate_next_n_gameweeks(self, num_gameweeks: int) -> Dict[int, List[float]]:
+        """Calculate expected points per player for the next N gameweeks.
+
+        Args:
+            num_gameweeks: Number of upcoming gameweeks to calculate
+
+        Returns:
+            Dictionary mapping player element IDs to list of expected points per gameweek
+        """
+        logger.info("Calculating expected points for next %s gameweeks", num_gameweeks)
 
-        # Get bootstrap data
-        bootstrap_data = await self.fpl_client.get_bootstrap_static()
+        # Get bootstrap data and all fixtures
+        bootstrap_data, fixtures_data = await asyncio.gather(
+            self.fpl_client.get_bootstrap_static(), self._get_fixtures()
+        )
         players_data = bootstrap_data.get("elements", [])
-        teams_data = bootstrap_data.get("teams", [])
         events_data = bootstrap_data.get("events", [])
 
-        # Get all fixtures
-        fixtures_data = await self._get_fixtures()
-
         # Find next gameweek
         next_event = self._get_next_event(events_data)
         if not next_event:
@@ -376,36 +485,24 @@ class ExpectedPointsService:
             return {}
 
         next_event_id = next_event["id"]
-        teams_lookup = {team["id"]: team for team in teams_data}
-
-        # Calculate expected points for each player for next N gameweeks
-        expected_points_map: Dict[int, List[float]] = {}
-
-        for player in players_data:
-            element_id = player["id"]
-            player_team_id = player.get("team")
-            gameweek_points = []
-
-            # Calculate for each of the next N gameweeks
-            for i in range(num_gameweeks):
-                event_id = next_event_id + i
-
-                # Get fixture for this gameweek
-                fixture = self._get_next_fixture_for_team(
-                    fixtures_data, player_team_id, event_id
-                )
-
-                # Calculate expected points for this gameweek
-                expected_points = await self._calculate_player_expected_points(
-                    player, fixture, teams_lookup
-                )
 
-                gameweek_points.append(expected_points)
+        # Calculate all players at once for each of the next N gameweeks
+        player_arrays = self._build_player_arrays(players_data)
+        fixture_index = self._index_fixtures(fixtures_data)
+        weekly_points = [
+            self._calculate_expected_points_batch(player_arrays, fixture_index, next_event_id + i)
+            for i in range(num_gameweeks)
+        ]
 
-            expected_points_map[element_id] = gameweek_points
+        # Transpose to one list of gameweek points per player
+        expected_points_map: Dict[int, List[float]] = {
+            element_id: list(gameweek_points)
+            for element_id, gameweek_points in zip(player_arrays["id"], zip(*weekly_points))
+        }
 
         logger.info(
-            f"Calculated expected points for {len(expected_points_map)} players "
-            f"across {num_gameweeks} gameweeks"
+            "Calculated expected points for %s players "
+            "across %s gameweeks",
+            len(expected_points_map), num_gameweeks
         )
         return expected_points_map
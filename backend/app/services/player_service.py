@@ -1,10 +1,12 @@
 """Player service for business logic."""
 
+import heapq
 import logging
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from app.repositories.player_repository import PlayerRepository
 from app.models.player import Player
+from app.models.player_filters import PlayerFilters
 from app.core.exceptions import NotFoundException
 
 logger = logging.getLogger(__name__)
@@ -27,7 +29,7 @@ class PlayerService:
         team_id: Optional[int] = None,
         min_cost: Optional[float] = None,
         max_cost: Optional[float] = None,
-    ) -> List[Player]:
+    ) -> Sequence[Player]:
         """Get all players with optional filters.
 
         Args:
@@ -37,34 +39,45 @@ class PlayerService:
             max_cost: Maximum cost in millions
 
         Returns:
-            List of players matching filters
+            Players matching filters (shared, must not be mutated)
         """
         logger.info(
-            f"Getting all players with filters: position={position}, "
-            f"team_id={team_id}, min_cost={min_cost}, max_cost={max_cost}"
+            "Getting all players with filters: position=%s, "
+            "team_id=%s, min_cost=%s, max_cost=%s",
+            position, team_id, min_cost, max_cost
         )
 
+        filters = PlayerFilters.from_query(position, team_id, min_cost, max_cost)
+
         # Get all players
         players = await self.player_repository.get_all_players()
 
-        # Apply filters
-        if position:
-            players = [p for p in players if p.position == position]
-
-        if team_id:
-            players = [p for p in players if p.team == team_id]
+        # Unfiltered requests get the shared snapshot without copying
+        if filters.is_empty:
+            logger.info("Retrieved %s players after filtering", len(players))
+            return players
 
-        if min_cost is not None:
-            min_cost_units = int(min_cost * 10)  # Convert to 0.1m units
-            players = [p for p in players if p.now_cost >= min_cost_units]
+        # An empty cost range cannot match anything, so skip the scan
+        if filters.is_unsatisfiable:
+            logger.info("Retrieved 0 players after filtering")
+            return []
 
-        if max_cost is not None:
-            max_cost_units = int(max_cost * 10)  # Convert to 0.1m units
-            players = [p for p in players if p.now_cost <= max_cost_units]
+        # Apply only the filters that are set, in one pass
+        match = filters.predicate()
+        players = [p for p in players if match(p)]
 
-        logger.info(f"Retrieved {len(players)} players after filtering")
+        logger.info("Retrieved %s players after filtering", len(players))
         return players
 
+    async def get_all_players_json(self) -> Tuple[int, bytes]:
+        """Get all players, unfiltered, as an encoded JSON array.
+
+        Returns:
+            Number of players and the JSON-encoded list
+        """
+        logger.info("Getting all players as JSON")
+        return await self.player_repository.get_all_players_json()
+
     async def get_player_by_id(self, player_id: int) -> Player:
         """Get player by ID.
 
@@ -77,7 +90,7 @@ class PlayerService:
         Raises:
             NotFoundException: If player not found
         """
-        logger.info(f"Getting player with ID: {player_id}")
+        logger.info("Getting player with ID: %s", player_id)
         player = await self.player_repository.get_player_by_id(player_id)
 
         if not player:
@@ -94,10 +107,8 @@ class PlayerService:
         Returns:
             List of top players
         """
-        logger.info(f"Getting top {limit} players by points")
+        logger.info("Getting top %s players by points", limit)
         players = await self.player_repository.get_all_players()
 
-        # Sort by total points descending
-        sorted_players = sorted(players, key=lambda p: p.total_points, reverse=True)
-
-        return sorted_players[:limit]
+        # Select the top N without sorting the whole player list
+        return heapq.nlargest(limit, players, key=lambda p: p.total_points)
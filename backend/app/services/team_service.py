@@ -29,7 +29,7 @@ class TeamService:
         Returns:
             Team data with optional picks
         """
-        logger.info(f"Getting team with ID: {team_id}, include_picks={include_picks}")
+        logger.info("Getting team with ID: %s, include_picks=%s", team_id, include_picks)
         team = await self.team_repository.get_team_by_id(team_id, include_picks)
         return team
 
@@ -42,7 +42,7 @@ class TeamService:
         Returns:
             Dictionary with team summary
         """
-        logger.info(f"Getting team summary for ID: {team_id}")
+        logger.info("Getting team summary for ID: %s", team_id)
         team = await self.team_repository.get_team_by_id(team_id, include_picks=True)
 
         # Get transfer information
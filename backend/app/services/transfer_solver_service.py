@@ -1,8 +1,8 @@
 """Transfer solver service using CVXPY for optimizing FPL transfers."""
 
+import asyncio
 import logging
-from typing import Dict, List, Optional
-import cvxpy as cp
+from typing import Dict, List, NotRequired, Optional, TypedDict
 import numpy as np
 
 from app.services.expected_points_service import ExpectedPointsService
@@ -13,14 +13,23 @@ from app.models.team_pick import TeamPick
 logger = logging.getLogger(__name__)
 
 
+class TransferRecord(TypedDict):
+    """Player moved in or out in a weekly solution."""
+
+    player_id: int
+    player_name: str
+    position: Optional[str]
+    cost: NotRequired[float]  # Only set for transfers in
+
+
 class TransferSolution:
     """Result of transfer optimization."""
 
     def __init__(
         self,
         gameweek: int,
-        transfers_in: List[Dict],
-        transfers_out: List[Dict],
+        transfers_in: List[TransferRecord],
+        transfers_out: List[TransferRecord],
         expected_points: float,
         transfer_cost: int,
         free_transfers_used: int,
@@ -99,6 +108,9 @@ class TransferSolverService:
     FREE_TRANSFERS_PER_WEEK = 1
     MAX_FREE_TRANSFERS = 5
 
+    # Solver statuses whose solution we accept
+    ACCEPTED_STATUSES = frozenset({"optimal", "optimal_inaccurate"})
+
     def __init__(
         self,
         expected_points_service: ExpectedPointsService,
@@ -134,18 +146,17 @@ class TransferSolverService:
             Complete transfer plan with weekly recommendations
         """
         logger.info(
-            f"Starting transfer optimization for {num_gameweeks} gameweeks, "
-            f"{free_transfers} free transfers, £{budget}m budget"
+            "Starting transfer optimization for %s gameweeks, "
+            "%s free transfers, £%sm budget",
+            num_gameweeks, free_transfers, budget
         )
 
-        # Get all players and expected points
-        all_players = await self.player_service.get_all_players()
-        logger.info(f"Retrieved {len(all_players)} players from database")
-
-        # Get expected points for next N gameweeks
-        expected_points_map = await self.expected_points_service.calculate_expected_points_next_n_gameweeks(
-            num_gameweeks
+        # Get all players and expected points for next N gameweeks concurrently
+        all_players, expected_points_map = await asyncio.gather(
+            self.player_service.get_all_players(),
+            self.expected_points_service.calculate_expected_points_next_n_gameweeks(num_gameweeks),
         )
+        logger.info("Retrieved %s players from database", len(all_players))
 
         # Create player lookup
         player_lookup = {p.id: p for p in all_players}
@@ -161,10 +172,13 @@ class TransferSolverService:
             current_squad, selling_prices, budget
         )
 
-        logger.info(f"Total available budget: £{total_available_budget:.1f}m")
+        logger.info("Total available budget: £%.1fm", total_available_budget)
 
-        # Build optimization model
-        solution = self._solve_cvxpy_model(
+        # Build and solve the optimization model. The solve is CPU-bound and
+        # can take seconds, so run it in a worker thread to keep the event
+        # loop serving other requests.
+        solution = await asyncio.to_thread(
+            self._solve_cvxpy_model,
             all_players=all_players,
             expected_points_map=expected_points_map,
             current_squad_ids=current_squad_ids,
@@ -186,7 +200,8 @@ class TransferSolverService:
         )
 
         logger.info(
-            f"Optimization complete. Total improvement: {transfer_plan.improvement:.1f} points"
+            "Optimization complete. Total improvement: %.1f points",
+            transfer_plan.improvement
         )
 
         return transfer_plan
@@ -197,7 +212,8 @@ class TransferSolverService:
         """Calculate selling price for each player in current squad.
 
         FPL rules:
-        - If player price increased: sell at purchase price + half of profit
+        - If player price increased: sell at purchase price + half of profit,
+          rounded down to the nearest £0.1m
         - If player price decreased: sell at current price (full loss)
 
         Args:
@@ -214,22 +230,22 @@ class TransferSolverService:
             player = player_lookup.get(player_id)
 
             if not player:
-                logger.warning(f"Player {player_id} not found in player lookup")
+                logger.warning("Player %s not found in player lookup", player_id)
                 selling_prices[player_id] = 0.0
                 continue
 
-            current_price = player.now_cost / 10.0  # Convert to millions
-            purchase_price = (pick.purchase_price or player.now_cost) / 10.0
+            # Work in integer £0.1m units and convert to millions once
+            current_price = player.now_cost
+            purchase_price = pick.purchase_price or player.now_cost
 
             if current_price >= purchase_price:
                 # Half profit rule
-                profit = current_price - purchase_price
-                selling_price = purchase_price + (profit / 2.0)
+                selling_price = purchase_price + (current_price - purchase_price) // 2
             else:
                 # Full loss
                 selling_price = current_price
 
-            selling_prices[player_id] = selling_price
+            selling_prices[player_id] = selling_price / 10.0
 
         return selling_prices
 
@@ -283,23 +299,34 @@ class TransferSolverService:
         Returns:
             Solution dictionary with decision variables
         """
+        # cvxpy dominates app import time, so load it only when a plan is solved
+        import cvxpy as cp
+
         logger.info("Building CVXPY optimization model...")
 
         num_players = len(all_players)
         player_ids = [p.id for p in all_players]
         player_id_to_idx = {pid: idx for idx, pid in enumerate(player_ids)}
 
-        # Player attributes as numpy arrays
-        player_costs = np.array([p.now_cost / 10.0 for p in all_players])  # in millions
-        player_teams = np.array([p.team for p in all_players])
-        player_positions = np.array([p.element_type for p in all_players])  # 1=GK, 2=DEF, 3=MID, 4=FWD
-
-        # Expected points matrix: (num_players x num_gameweeks)
+        # Player attributes as contiguous numpy columns; costs stay in integer
+        # £0.1m units so the budget constraint has no float rounding error
+        player_costs = np.fromiter((p.now_cost for p in all_players), dtype=int, count=num_players)
+        budget_units = int(round(total_budget * 10))
+        player_teams = np.fromiter((p.team for p in all_players), dtype=int, count=num_players)
+        player_positions = np.fromiter(
+            (p.element_type for p in all_players), dtype=int, count=num_players
+        )  # 1=GK, 2=DEF, 3=MID, 4=FWD
+
+        # One-hot membership matrices so each group constraint is a single matrix product
+        position_matrix = (player_positions == np.arange(1, 5)[:, None]).astype(float)  # 4 x players
+        team_matrix = (player_teams == np.arange(1, 21)[:, None]).astype(float)  # 20 x players
+        squad_position_counts = np.array([self.NUM_GK, self.NUM_DEF, self.NUM_MID, self.NUM_FWD])
+
+        # Expected points matrix: (num_players x num_gameweeks), rows in player order
         expected_points_matrix = np.zeros((num_players, num_gameweeks))
-        for player in all_players:
-            idx = player_id_to_idx[player.id]
-            points_list = expected_points_map.get(player.id, [0.0] * num_gameweeks)
-            expected_points_matrix[idx, :] = points_list[:num_gameweeks]
+        for idx, pid in enumerate(player_ids):
+            points_list = expected_points_map.get(pid, ())[:num_gameweeks]
+            expected_points_matrix[idx, : len(points_list)] = points_list
 
         # Discount factors for each gameweek
         discount_factors = np.array([discount_factor ** gw for gw in range(num_gameweeks)])
@@ -338,6 +365,24 @@ class TransferSolverService:
         # Initial free transfers
         constraints.append(free_transfers_remaining[0] == initial_free_transfers)
 
+        # Position and team limits for every gameweek at once
+        squad_by_position = position_matrix @ squad  # 4 x gameweeks
+        starting_by_position = position_matrix @ starting
+        constraints.append(squad_by_position == squad_position_counts[:, None])
+        constraints.append(team_matrix @ squad <= self.MAX_PLAYERS_PER_TEAM)  # 20 Premier League teams
+
+        # Starting XI position constraints (at least one valid formation)
+        # We'll use a simplified constraint: require minimum players per position
+        constraints.append(starting_by_position[0, :] == 1)  # Exactly 1 GK
+        constraints.append(starting_by_position[1, :] >= 3)  # At least 3 DEF
+        constraints.append(starting_by_position[3, :] >= 1)  # At least 1 FWD
+
+        # Position balance: transfers in/out must maintain position counts
+        constraints.append(position_matrix @ transfers_in == position_matrix @ transfers_out)
+
+        # Budget constraint (total cost of any squad must not exceed total budget)
+        constraints.append(player_costs @ squad <= budget_units)
+
         # Squad evolution constraints
         for t in range(num_gameweeks):
             if t > 0:
@@ -349,28 +394,10 @@ class TransferSolverService:
             # Squad size
             constraints.append(cp.sum(squad[:, t]) == self.SQUAD_SIZE)
 
-            # Position constraints
-            constraints.append(cp.sum(squad[:, t] * (player_positions == 1)) == self.NUM_GK)
-            constraints.append(cp.sum(squad[:, t] * (player_positions == 2)) == self.NUM_DEF)
-            constraints.append(cp.sum(squad[:, t] * (player_positions == 3)) == self.NUM_MID)
-            constraints.append(cp.sum(squad[:, t] * (player_positions == 4)) == self.NUM_FWD)
-
-            # Max players per team
-            for team_id in range(1, 21):  # 20 Premier League teams
-                constraints.append(
-                    cp.sum(squad[:, t] * (player_teams == team_id)) <= self.MAX_PLAYERS_PER_TEAM
-                )
-
             # Starting XI constraints
             constraints.append(cp.sum(starting[:, t]) == self.STARTING_XI_SIZE)
             constraints.append(starting[:, t] <= squad[:, t])  # Can only start if in squad
 
-            # Starting XI position constraints (at least one valid formation)
-            # We'll use a simplified constraint: require minimum players per position
-            constraints.append(cp.sum(starting[:, t] * (player_positions == 1)) == 1)  # Exactly 1 GK
-            constraints.append(cp.sum(starting[:, t] * (player_positions == 2)) >= 3)  # At least 3 DEF
-            constraints.append(cp.sum(starting[:, t] * (player_positions == 4)) >= 1)  # At least 1 FWD
-
             # Transfer constraints
             num_transfers = cp.sum(transfers_in[:, t])
             constraints.append(cp.sum(transfers_out[:, t]) == num_transfers)  # Equal in/out
@@ -388,14 +415,6 @@ class TransferSolverService:
             else:
                 constraints.append(transfers_in[:, t] <= 1 - current_squad_vector)
 
-            # Position balance: transfers in/out must maintain position counts
-            # For each position, transfers_in for that position == transfers_out for that position
-            for position in range(1, 5):  # 1=GK, 2=DEF, 3=MID, 4=FWD
-                constraints.append(
-                    cp.sum(transfers_in[:, t] * (player_positions == position)) ==
-                    cp.sum(transfers_out[:, t] * (player_positions == position))
-                )
-
             # Free transfer mechanics (reformulated for MILP)
             # Constraints for paid transfers: paid = max(0, num_transfers - free_available)
             if t > 0:
@@ -425,10 +444,6 @@ class TransferSolverService:
                 constraints.append(free_transfers_remaining[t] <= self.MAX_FREE_TRANSFERS)
                 constraints.append(free_transfers_remaining[t] >= 0)
 
-        # Budget constraint (total cost of any squad must not exceed total budget)
-        for t in range(num_gameweeks):
-            constraints.append(cp.sum(squad[:, t] * player_costs) <= total_budget)
-
         # Objective: Maximize discounted expected points minus transfer penalties
         # Also add small value for having banked free transfers (flexibility bonus)
         total_points = 0
@@ -462,7 +477,7 @@ class TransferSolverService:
         try:
             from cvxpy import installed_solvers
             available_solvers = installed_solvers()
-            logger.info(f"Available solvers: {available_solvers}")
+            logger.info("Available solvers: %s", available_solvers)
         except:
             available_solvers = []
 
@@ -489,22 +504,22 @@ class TransferSolverService:
 
         for solver, solver_name in solvers_to_try:
             try:
-                logger.info(f"Trying solver: {solver_name}")
+                logger.info("Trying solver: %s", solver_name)
                 if solver is None:
                     # Try default solver
                     problem.solve(verbose=False)
                 else:
                     problem.solve(solver=solver, verbose=False)
 
-                if problem.status in ["optimal", "optimal_inaccurate"]:
-                    logger.info(f"✓ Solved with {solver_name}! Status: {problem.status}, Value: {problem.value}")
+                if problem.status in self.ACCEPTED_STATUSES:
+                    logger.info("✓ Solved with %s! Status: %s, Value: %s", solver_name, problem.status, problem.value)
                     solved = True
                     break
                 else:
-                    logger.warning(f"Solver {solver_name} finished with status: {problem.status}")
+                    logger.warning("Solver %s finished with status: %s", solver_name, problem.status)
                     last_error = f"Solver {solver_name} status: {problem.status}"
             except Exception as e:
-                logger.warning(f"Solver {solver_name} failed: {e}")
+                logger.warning("Solver %s failed: %s", solver_name, e)
                 last_error = str(e)
                 continue
 
@@ -532,6 +547,7 @@ class TransferSolverService:
             "free_transfers_remaining": free_transfers_remaining.value,
             "paid_transfers": paid_transfers.value,
             "player_ids": player_ids,
+            "player_positions": player_positions,
             "expected_points_matrix": expected_points_matrix,
             "discount_factors": discount_factors,
         }
@@ -558,8 +574,15 @@ class TransferSolverService:
         Returns:
             Transfer plan with weekly solutions
         """
-        player_lookup = {p.id: p for p in all_players}
         player_ids = solution["player_ids"]
+        player_positions = solution["player_positions"]
+
+        # Threshold the relaxed binaries once for every gameweek
+        transfers_in_mask = solution["transfers_in"] > 0.5
+        transfers_out_mask = solution["transfers_out"] > 0.5
+        weekly_expected_points = np.where(
+            solution["starting"] > 0.5, solution["expected_points_matrix"], 0.0
+        ).sum(axis=0)
 
         weekly_solutions = []
         total_transfer_cost = 0
@@ -568,48 +591,30 @@ class TransferSolverService:
         free_transfers = initial_free_transfers
 
         for t in range(num_gameweeks):
-            # Extract transfers
-            transfers_in_indices = np.where(solution["transfers_in"][:, t] > 0.5)[0]
-            transfers_out_indices = np.where(solution["transfers_out"][:, t] > 0.5)[0]
+            # Extract transfers, ordered by position (GK → DEF → MID → FWD)
+            transfers_in_indices = self._indices_by_position(transfers_in_mask[:, t], player_positions)
+            transfers_out_indices = self._indices_by_position(transfers_out_mask[:, t], player_positions)
 
-            transfers_in_list = []
+            transfers_in_list: List[TransferRecord] = []
             for idx in transfers_in_indices:
-                player_id = player_ids[idx]
-                player = player_lookup[player_id]
+                player = all_players[idx]
                 transfers_in_list.append({
-                    "player_id": player_id,
+                    "player_id": player_ids[idx],
                     "player_name": player.web_name,
                     "position": player.position,
-                    "position_id": player.element_type,  # For sorting: 1=GK, 2=DEF, 3=MID, 4=FWD
                     "cost": player.now_cost / 10.0,
                 })
 
-            transfers_out_list = []
+            transfers_out_list: List[TransferRecord] = []
             for idx in transfers_out_indices:
-                player_id = player_ids[idx]
-                player = player_lookup[player_id]
+                player = all_players[idx]
                 transfers_out_list.append({
-                    "player_id": player_id,
+                    "player_id": player_ids[idx],
                     "player_name": player.web_name,
                     "position": player.position,
-                    "position_id": player.element_type,  # For sorting: 1=GK, 2=DEF, 3=MID, 4=FWD
                 })
 
-            # Sort by position (GK → DEF → MID → FWD)
-            transfers_in_list.sort(key=lambda x: x["position_id"])
-            transfers_out_list.sort(key=lambda x: x["position_id"])
-
-            # Remove position_id before storing (only needed for sorting)
-            for transfer in transfers_in_list:
-                del transfer["position_id"]
-            for transfer in transfers_out_list:
-                del transfer["position_id"]
-
-            # Calculate expected points for this gameweek
-            starting_indices = np.where(solution["starting"][:, t] > 0.5)[0]
-            gameweek_expected_points = sum(
-                solution["expected_points_matrix"][idx, t] for idx in starting_indices
-            )
+            gameweek_expected_points = float(weekly_expected_points[t])
 
             # Transfer costs
             num_transfers = len(transfers_in_list)
@@ -657,6 +662,20 @@ class TransferSolverService:
             current_expected_points=current_expected_points,
         )
 
+    @staticmethod
+    def _indices_by_position(selected: np.ndarray, player_positions: np.ndarray) -> np.ndarray:
+        """Get indices of selected players, stably ordered by position.
+
+        Args:
+            selected: Boolean mask over players
+            player_positions: Element type per player (1=GK, 2=DEF, 3=MID, 4=FWD)
+
+        Returns:
+            Player indices sorted GK → DEF → MID → FWD, keeping index order within a position
+        """
+        indices = np.flatnonzero(selected)
+        return indices[np.argsort(player_positions[indices], kind="stable")]
+
     def _calculate_current_expected_points(
         self,
         current_squad_ids: List[int],
@@ -677,19 +696,14 @@ class TransferSolverService:
         Returns:
             Total expected points with current squad
         """
-        total = 0.0
+        # Squad x gameweek matrix, padding missing gameweeks with zero
+        points = np.zeros((len(current_squad_ids), num_gameweeks))
+        for row, pid in enumerate(current_squad_ids):
+            points_list = expected_points_map.get(pid, ())[:num_gameweeks]
+            points[row, : len(points_list)] = points_list
 
-        for t in range(num_gameweeks):
-            # Get expected points for each player in current squad
-            player_points = []
-            for pid in current_squad_ids:
-                points_list = expected_points_map.get(pid, [0.0] * num_gameweeks)
-                player_points.append(points_list[t] if t < len(points_list) else 0.0)
-
-            # Take top 11 (simple assumption for starting XI)
-            player_points.sort(reverse=True)
-            gameweek_total = sum(player_points[:11])
+        # Take top 11 per gameweek (simple assumption for starting XI)
+        points.sort(axis=0)
+        weekly_totals = points[-self.STARTING_XI_SIZE :].sum(axis=0)
 
-            total += discount_factors[t] * gameweek_total
-
-        return total
+        return float(weekly_totals @ discount_factors[:num_gameweeks])
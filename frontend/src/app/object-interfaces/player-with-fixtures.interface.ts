@@ -12,8 +12,8 @@ export interface PlayerWithFixtures {
   position?: string;
   now_cost: number; // In £0.1m units
   total_points: number;
-  form: string;
-  selected_by_percent: string;
+  form: number;
+  selected_by_percent: number;
   minutes: number;
   status: string;
   news: string;
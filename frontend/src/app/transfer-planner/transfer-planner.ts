@@ -202,8 +202,8 @@ export class TransferPlanner implements OnInit, OnDestroy {
           bVal = b.now_cost;
           break;
         case 'form':
-          aVal = parseFloat(a.form);
-          bVal = parseFloat(b.form);
+          aVal = a.form;
+          bVal = b.form;
           break;
         case 'total_points':
           aVal = a.total_points;